@@ -114,7 +114,7 @@ def _build_quality_suite_progress_renderer(
             duration = f"{event.result.duration:.2f}s"
         console.print(f"{icon} {bar} {_format_progress_label(event)} ({duration})")
         if not success and event.result is not None:
-            output = event.result.output.strip()
+            output = event.result.read_output().strip()
             if output:
                 console.print(Panel(Text(output, style="red"), title="Command output"))
 
@@ -560,6 +560,17 @@ def refactor_analyze(
         "--json",
         help="Emit machine-readable JSON report",
     ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for a persistent parsed-AST cache reused across runs",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=0,
+        help="Worker processes for per-file analysis (0 or 1 runs in-process)",
+    ),
 ) -> None:
     """Run refactor opportunity analysis."""
 
@@ -572,6 +583,8 @@ def refactor_analyze(
         max_parameters=max_parameters,
         min_docstring_length=min_docstring_length,
         coverage_threshold=coverage_threshold,
+        cache_dir=cache_dir,
+        max_workers=workers,
     )
 
     if json_output:
@@ -590,7 +603,7 @@ def refactor_analyze(
         "warning": "yellow",
         "info": "cyan",
     }
-    for opportunity in report.opportunities:
+    for opportunity in report.ranked():
         style = severity_styles.get(opportunity.severity, "white")
         metric_hint = ""
         if opportunity.metric is not None and opportunity.threshold is not None:
@@ -635,6 +648,17 @@ def refactor_hotspots(
         "--json",
         help="Emit machine-readable JSON report",
     ),
+    cache_dir: Path | None = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for a persistent parsed-AST cache reused across runs",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=0,
+        help="Worker processes for per-file analysis (0 or 1 runs in-process)",
+    ),
 ) -> None:
     """Identify code hotspots by combining churn and complexity."""
 
@@ -642,6 +666,8 @@ def refactor_hotspots(
         since=since,
         min_complexity=min_complexity,
         min_churn=min_churn,
+        cache_dir=cache_dir,
+        max_workers=workers,
     )
 
     if json_output:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import io
 import json
+import sys
 import textwrap
 from datetime import UTC, datetime
 from pathlib import Path
@@ -20,7 +22,12 @@ from hephaestus.toolbox import (
     QualitySuiteProgressEvent,
     QualitySuiteRecommendation,
     QualitySuiteRunReport,
+    RefactorOpportunity,
+    RefactorReport,
+    _source_metrics,
     analyze_refactor_opportunities,
+    available_quality_gates,
+    available_quality_profiles,
     build_quality_suite_insights,
     build_quality_suite_monitoring,
     build_quality_suite_plan,
@@ -35,6 +42,7 @@ from hephaestus.toolbox import (
     quality_suite_guide,
     quality_suite_manifest,
     resolve_quality_profile,
+    run_command,
     run_quality_suite,
     sync_diataxis_documentation,
     sync_quality_suite_documentation,
@@ -111,6 +119,68 @@ def test_coverage_report_parsing(tmp_path: Path) -> None:
     assert summary.coverage == pytest.approx(52.0)
 
 
+def test_coverage_report_reuses_json_cache(tmp_path: Path) -> None:
+    xml = _write_coverage(tmp_path)
+    cache_dir = tmp_path / "cache"
+    first = CoverageReport.from_xml(xml, cache_dir=cache_dir)
+    entries = list(cache_dir.glob("coverage-*.json"))
+    assert len(entries) == 1
+    assert not list(tmp_path.glob("coverage.xml.*"))
+
+    cached = CoverageReport.from_xml(xml, cache_dir=cache_dir)
+    assert cached.all_modules() == first.all_modules()
+    assert cached.summary == first.summary
+
+    contents = xml.read_text(encoding="utf-8")
+    xml.write_text(
+        contents.replace('statements="80"', 'statements="800"'), encoding="utf-8"
+    )
+    refreshed = CoverageReport.from_xml(xml, cache_dir=cache_dir)
+    cli_module = refreshed.get("src/hephaestus/cli/main.py")
+    assert cli_module is not None and cli_module.statements == 800
+
+    entries[0].write_text("not json", encoding="utf-8")
+    recovered = CoverageReport.from_xml(xml, cache_dir=cache_dir)
+    assert recovered.all_modules() == refreshed.all_modules()
+
+    payload = json.loads(entries[0].read_text(encoding="utf-8"))
+    payload["modules"][0][4] = [-1, 2**40]
+    entries[0].write_text(json.dumps(payload), encoding="utf-8")
+    tampered = CoverageReport.from_xml(xml, cache_dir=cache_dir)
+    assert tampered.all_modules() == refreshed.all_modules()
+
+
+def test_coverage_report_untrusted_skips_cache(tmp_path: Path) -> None:
+    xml = _write_coverage(tmp_path)
+    cache_dir = tmp_path / "cache"
+    CoverageReport.from_xml(xml, cache_dir=cache_dir, trusted=False)
+    assert not cache_dir.exists()
+
+
+def test_coverage_report_parsers_agree(tmp_path: Path) -> None:
+    xml = _write_coverage(tmp_path)
+    trusted = CoverageReport.from_xml(xml, trusted=True)
+    hardened = CoverageReport.from_xml(xml, trusted=False)
+    assert trusted.all_modules() == hardened.all_modules()
+    assert trusted.summary == hardened.summary
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_coverage_report_rejects_missing_coverage_root(
+    tmp_path: Path, trusted: bool
+) -> None:
+    xml = tmp_path / "coverage.xml"
+    xml.write_text(
+        '<package name="pkg" line-rate="0.5"><classes>'
+        '<class filename="a.py" line-rate="0.5"><lines>'
+        '<line number="1" hits="1"/></lines></class>'
+        "</classes></package>",
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match="<coverage> root"):
+        CoverageReport.from_xml(xml, trusted=trusted)
+
+
 def test_coverage_gap_summary(tmp_path: Path) -> None:
     xml = _write_coverage(tmp_path)
     report = CoverageReport.from_xml(xml)
@@ -130,6 +200,18 @@ def test_coverage_guard(tmp_path: Path) -> None:
     assert passed_success
 
 
+def test_coverage_guard_failure_message_layout(tmp_path: Path) -> None:
+    xml = _write_coverage(tmp_path)
+    report = CoverageReport.from_xml(xml)
+    _, message = coverage_guard(report, threshold=70.0, limit=1)
+    assert message.splitlines() == [
+        "❌ Coverage 52.00% is below the required 70.00%.",
+        "Missing lines: 110 (covered 120 of 230).",
+        "Hotspots:",
+        "  • src/hephaestus/cli/main.py: 40.00% (48 missing of 80)",
+    ]
+
+
 def test_build_quality_suite_monitoring_highlights_cli_and_service(
     tmp_path: Path,
 ) -> None:
@@ -269,12 +351,60 @@ def test_quality_configuration_load(tmp_path: Path) -> None:
     assert config.profiles["docs"] == ("docs",)
 
 
+def test_quality_configuration_load_is_cached_until_pyproject_changes(
+    tmp_path: Path,
+) -> None:
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[tool.hephaestus.toolkit.profiles.docs]\ngates = ["docs"]\n',
+        encoding="utf-8",
+    )
+    config = load_quality_configuration(tmp_path)
+    config.profiles["docs"] = ("edited",)
+    config.gates.clear()
+    assert load_quality_configuration(tmp_path).profiles["docs"] == ("docs",)
+
+    pyproject.write_text(
+        '[tool.hephaestus.toolkit.profiles.docs]\ngates = ["docs", "lint"]\n',
+        encoding="utf-8",
+    )
+    reloaded = load_quality_configuration(tmp_path)
+    assert reloaded.profiles["docs"] == ("docs", "lint")
+
+
 def test_resolve_quality_profile_uses_defaults() -> None:
     config = QualityConfiguration(gates={}, profiles={})
     gates = resolve_quality_profile("fast", config=config)
     assert [gate.name for gate in gates] == ["tests", "lint"]
 
 
+def test_available_quality_catalog_returns_independent_copies() -> None:
+    config = QualityConfiguration(gates={}, profiles={"solo": ("lint",)})
+    profiles = available_quality_profiles(config)
+    profiles.clear()
+    available_quality_gates(config).clear()
+
+    assert available_quality_profiles(config)["solo"] == ("lint",)
+    assert "lint" in available_quality_gates(config)
+    assert [gate.name for gate in resolve_quality_profile("solo", config=config)] == [
+        "lint"
+    ]
+
+
+def test_merged_catalog_tracks_configuration_edits() -> None:
+    config = QualityConfiguration(gates={}, profiles={"solo": ("lint",)})
+    assert [gate.name for gate in resolve_quality_profile("solo", config=config)] == [
+        "lint"
+    ]
+
+    config.profiles["solo"] = ("types",)
+    assert [gate.name for gate in resolve_quality_profile("solo", config=config)] == [
+        "types"
+    ]
+    config.profiles["pair"] = ("lint", "types")
+    assert "pair" in available_quality_profiles(config)
+
+
 def test_build_quality_suite_plan_applies_toggles() -> None:
     plan = build_quality_suite_plan("fast", toggles={"lint": False, "types": True})
     assert plan.gate_names() == ("tests", "types")
@@ -337,6 +467,14 @@ def test_quality_suite_plan_insights_track_categories() -> None:
     assert ("security", True) in insights.toggles
 
 
+def test_quality_gates_are_immutable_and_slotted() -> None:
+    gate = resolve_quality_profile("fast")[0]
+
+    assert not hasattr(gate, "__dict__")
+    with pytest.raises(AttributeError):
+        gate.critical = False  # type: ignore[misc]
+
+
 def test_build_quality_suite_plan_supports_contracts_toggle() -> None:
     plan = build_quality_suite_plan("fast", toggles={"contracts": True})
     gate_names = plan.gate_names()
@@ -391,7 +529,9 @@ def test_run_quality_suite_emits_progress_events(monkeypatch: MonkeyPatch) -> No
         quality_gate.command, 0, 0.12, "passed", gate=quality_gate.name
     )
 
-    def fake_run_command(command, *, check=True, cwd=None, env=None, gate=None):
+    def fake_run_command(
+        command, *, check=True, cwd=None, env=None, gate=None, capture="memory"
+    ):
         assert tuple(command) == quality_gate.command
         assert gate == quality_gate.name
         return result
@@ -408,6 +548,77 @@ def test_run_quality_suite_emits_progress_events(monkeypatch: MonkeyPatch) -> No
     assert completed.index == 1 and completed.total == 1
 
 
+def test_run_quality_suite_runs_concurrently_in_input_order() -> None:
+    commands = [
+        [sys.executable, "-c", "import time; time.sleep(0.2)"],
+        [sys.executable, "-c", "print('fast')"],
+    ]
+
+    results = run_quality_suite(commands, halt_on_failure=False, max_workers=2)
+
+    assert [result.command for result in results] == [tuple(c) for c in commands]
+    assert results[1].output.strip() == "fast"
+
+
+def test_run_command_capture_modes() -> None:
+    command = [sys.executable, "-c", "import sys; print('out'); sys.exit(3)"]
+
+    to_file = run_command(command, check=False, capture="file")
+    assert to_file.output == ""
+    assert to_file.output_path is not None
+    assert to_file.read_output().strip() == "out"
+    assert to_file.to_payload()["output"] == to_file.read_output()
+    to_file.output_path.unlink()
+
+    discarded = run_command(command, check=False, capture="none")
+    assert discarded.returncode == 3
+    assert discarded.output_path is None
+    assert discarded.read_output() == ""
+
+
+def test_run_quality_suite_halts_before_pending_commands(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    invoked: list[tuple[str, ...]] = []
+
+    def fake_run_command(
+        command, *, check=True, cwd=None, env=None, gate=None, capture="memory"
+    ):
+        invoked.append(tuple(command))
+        returncode = 1 if command[0] == "fail" else 0
+        return CommandResult(tuple(command), returncode, 0.0, "", gate=gate)
+
+    monkeypatch.setattr("hephaestus.toolbox.run_command", fake_run_command)
+
+    results = run_quality_suite(
+        [("ok",), ("fail",), ("never",)], halt_on_failure=True, max_workers=1
+    )
+
+    assert [result.command for result in results] == [("ok",), ("fail",)]
+    assert ("never",) not in invoked
+
+
+def test_run_quality_suite_surfaces_launch_errors(monkeypatch: MonkeyPatch) -> None:
+    invoked: list[tuple[str, ...]] = []
+
+    def fake_run_command(
+        command, *, check=True, cwd=None, env=None, gate=None, capture="memory"
+    ):
+        invoked.append(tuple(command))
+        if command[0] == "missing":
+            raise FileNotFoundError(command[0])
+        return CommandResult(tuple(command), 0, 0.0, "", gate=gate)
+
+    monkeypatch.setattr("hephaestus.toolbox.run_command", fake_run_command)
+
+    with pytest.raises(FileNotFoundError):
+        run_quality_suite([("ok",), ("missing",), ("never",)])
+    assert invoked == [("ok",), ("missing",)]
+
+    with pytest.raises(FileNotFoundError):
+        run_quality_suite([("missing",), ("ok",)], halt_on_failure=False, max_workers=2)
+
+
 def test_execute_quality_suite_forwards_progress(monkeypatch: MonkeyPatch) -> None:
     gate = QualityGate(
         name="tests",
@@ -936,6 +1147,165 @@ def test_refactor_report_payload_is_sorted(tmp_path: Path) -> None:
     assert ranks == sorted(ranks, reverse=True)
 
 
+def test_refactor_report_top_matches_ranked_prefix() -> None:
+    def _opportunity(line: int, severity: str, metric: int) -> RefactorOpportunity:
+        return RefactorOpportunity(
+            path=Path("src/example.py"),
+            line=line,
+            symbol=None,
+            kind="function_length",
+            severity=severity,  # type: ignore[arg-type]
+            message="Function exceeds threshold",
+            metric=metric,
+            threshold=10,
+        )
+
+    opportunities = (
+        _opportunity(1, "info", 11),
+        _opportunity(2, "critical", 30),
+        _opportunity(3, "warning", 15),
+        _opportunity(4, "critical", 45),
+    )
+    report = RefactorReport(opportunities=opportunities)
+
+    assert report.opportunities == opportunities
+    assert [op.line for op in report.top(2)] == [4, 2]
+    assert [op.line for op in report.ranked()] == [4, 2, 3, 1]
+    assert report.top(3) == report.ranked()[:3]
+
+
+def test_analyze_refactor_opportunities_reports_todo_line_numbers(
+    tmp_path: Path,
+) -> None:
+    module = tmp_path / "todos.py"
+    module.write_text(
+        "# TODO: first\nvalue = 1\n\n# FIXME second\nother = 2  # XXX: third\n",
+        encoding="utf-8",
+    )
+
+    report = analyze_refactor_opportunities((module,))
+
+    lines = sorted(op.line for op in report.opportunities if op.kind == "todo_comment")
+    assert lines == [1, 4, 5]
+
+
+def test_analyze_refactor_opportunities_sees_files_added_after_first_scan(
+    tmp_path: Path,
+) -> None:
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "first.py").write_text("# TODO: first\n", encoding="utf-8")
+
+    before = analyze_refactor_opportunities((tmp_path,))
+    nested = package / "nested"
+    nested.mkdir()
+    (nested / "second.py").write_text("# TODO: second\n", encoding="utf-8")
+    after = analyze_refactor_opportunities((tmp_path,))
+
+    assert len(before.opportunities) == 1
+    assert {op.path.name for op in after.opportunities} == {"first.py", "second.py"}
+
+
+def test_analyze_refactor_opportunities_reuses_ast_cache(tmp_path: Path) -> None:
+    module = tmp_path / "cached.py"
+    module.write_text(
+        textwrap.dedent(
+            """
+            def branchy(value):
+                if value:
+                    return value
+                return None
+            # TODO: simplify branching
+            """
+        ).strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / "ast-cache"
+
+    cold = analyze_refactor_opportunities((module,), cache_dir=cache_dir)
+    cached_entries = list(cache_dir.rglob("*.pkl"))
+    assert len(cached_entries) == 1
+
+    # Drop in-process memoisation so the on-disk cache is exercised.
+    _source_metrics.cache_clear()
+    warm = analyze_refactor_opportunities((module,), cache_dir=cache_dir)
+    assert [op.to_payload() for op in warm.opportunities] == [
+        op.to_payload() for op in cold.opportunities
+    ]
+
+    for corrupt in (b"not a pickle", b"\x80\x05cnope_mod_xyz\nx\n."):
+        cached_entries[0].write_bytes(corrupt)
+        _source_metrics.cache_clear()
+        recovered = analyze_refactor_opportunities((module,), cache_dir=cache_dir)
+        assert [op.kind for op in recovered.opportunities] == [
+            op.kind for op in cold.opportunities
+        ]
+
+
+def test_source_metrics_are_shared_read_only() -> None:
+    source = textwrap.dedent(
+        """
+        def outer(x):
+            def inner(y):
+                if y:
+                    return y
+            if x:
+                return inner(x)
+        """
+    ).encode()
+    symbols = _source_metrics(source, "shared.py")
+    assert [(symbol.qualname, symbol.complexity) for symbol in symbols] == [
+        ("outer", 3),
+        ("outer.inner", 2),
+    ]
+    with pytest.raises(AttributeError):
+        symbols[0].complexity = 99  # type: ignore[misc]
+    assert _source_metrics(source, "shared.py")[0].complexity == 3
+
+
+def test_analyze_refactor_opportunities_parallel_matches_sequential(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    for index in range(4):
+        (tmp_path / f"module_{index}.py").write_text(
+            textwrap.dedent(
+                f"""
+                def handler_{index}(a, b, c, d):
+                    if a and b:
+                        return c
+                    return d
+                # TODO: collapse handler {index}
+                """
+            ).strip()
+            + "\n",
+            encoding="utf-8",
+        )
+
+    sequential = analyze_refactor_opportunities((tmp_path,), max_parameters=3)
+    monkeypatch.setattr("hephaestus.toolbox._PARALLEL_FILE_THRESHOLD", 1)
+    parallel = analyze_refactor_opportunities((tmp_path,), max_parameters=3)
+
+    assert [op.to_payload() for op in parallel.opportunities] == [
+        op.to_payload() for op in sequential.opportunities
+    ]
+
+    class _UnavailablePool:
+        def __init__(self, max_workers: int | None = None) -> None:
+            raise OSError("process pools unavailable")
+
+    monkeypatch.setattr("hephaestus.toolbox.ProcessPoolExecutor", _UnavailablePool)
+    fallback = analyze_refactor_opportunities((tmp_path,), max_parameters=3)
+    serial = analyze_refactor_opportunities(
+        (tmp_path,), max_parameters=3, max_workers=1
+    )
+
+    for report in (fallback, serial):
+        assert [op.to_payload() for op in report.opportunities] == [
+            op.to_payload() for op in sequential.opportunities
+        ]
+
+
 def test_analyze_hotspots_combines_churn_and_complexity(
     tmp_path: Path, monkeypatch: MonkeyPatch
 ) -> None:
@@ -989,16 +1359,25 @@ def test_analyze_hotspots_combines_churn_and_complexity(
     )
 
     # Mock git log to return controlled churn data
-    def fake_subprocess_run(cmd, *args, **kwargs):
-        class FakeResult:
-            returncode = 0
-            stdout = f"{complex_file.relative_to(tmp_path)}\n{complex_file.relative_to(tmp_path)}\n{simple_file.relative_to(tmp_path)}\n"
+    class FakeProcess:
+        returncode = 0
+
+        def __init__(self, cmd, *args, **kwargs):
+            if cmd[0] != "git" or cmd[1] != "log":
+                raise FileNotFoundError()
+            complex_name = complex_file.relative_to(tmp_path).as_posix()
+            simple_name = simple_file.relative_to(tmp_path).as_posix()
+            self.stdout = io.BytesIO(
+                f"{complex_name}\0\0{complex_name}\0{simple_name}\0".encode()
+            )
 
-        if cmd[0] == "git" and cmd[1] == "log":
-            return FakeResult()
-        raise FileNotFoundError()
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
 
-    monkeypatch.setattr("subprocess.run", fake_subprocess_run)
+    monkeypatch.setattr("subprocess.Popen", FakeProcess)
 
     report = analyze_hotspots(repo_root=tmp_path, min_complexity=0, min_churn=1)
 
@@ -1030,10 +1409,10 @@ def test_analyze_hotspots_without_git(tmp_path: Path, monkeypatch: MonkeyPatch)
     )
 
     # Mock subprocess to simulate git not available
-    def fake_subprocess_run(cmd, *args, **kwargs):
+    def fake_popen(cmd, *args, **kwargs):
         raise FileNotFoundError()
 
-    monkeypatch.setattr("subprocess.run", fake_subprocess_run)
+    monkeypatch.setattr("subprocess.Popen", fake_popen)
 
     # Should not crash when git is unavailable
     report = analyze_hotspots(repo_root=tmp_path, min_complexity=0, min_churn=0)
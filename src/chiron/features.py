@@ -7,6 +7,9 @@ a vendor-agnostic feature flag SDK.
 from __future__ import annotations
 
 import os
+import threading
+from collections.abc import Hashable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 __all__ = ["FeatureFlags", "get_feature_flags", "is_feature_enabled"]
@@ -28,46 +31,85 @@ except ImportError:
         )
 
 
+_TRUTHY_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+@lru_cache(maxsize=128)
+def _env_flag_key(flag_key: str) -> str:
+    """Return the environment variable consulted for *flag_key*."""
+    return f"CHIRON_FEATURE_{flag_key.upper()}"
+
+
+def _read_env_flag(flag_key: str) -> str | None:
+    """Return the raw environment override for *flag_key*, if any."""
+    return os.getenv(_env_flag_key(flag_key))
+
+
+def _read_env_bool(flag_key: str) -> bool | None:
+    """Return the parsed boolean override for *flag_key*, or None when unset."""
+    raw = os.getenv(_env_flag_key(flag_key))
+    return None if raw is None else raw.lower() in _TRUTHY_VALUES
+
+
+class _DefaultFlagsAttribute:
+    """Expose ``FeatureFlags.DEFAULT_FLAGS`` without building it at import."""
+
+    def __get__(
+        self, instance: object, owner: type[FeatureFlags]
+    ) -> dict[str, InMemoryFlag[bool]]:
+        if not OPENFEATURE_AVAILABLE:
+            return {}
+        return owner._default_flags()
+
+
 class FeatureFlags:
     """Feature flag manager using OpenFeature."""
 
-    if OPENFEATURE_AVAILABLE:
-        DEFAULT_FLAGS: dict[str, InMemoryFlag[bool]] = {
-            "allow_public_publish": InMemoryFlag(
-                default_variant="off",
-                variants={"on": True, "off": False},
-            ),
-            "require_slsa_provenance": InMemoryFlag(
-                default_variant="on",
-                variants={"on": True, "off": False},
-            ),
-            "enable_oci_distribution": InMemoryFlag(
-                default_variant="off",
-                variants={"on": True, "off": False},
-            ),
-            "enable_tuf_metadata": InMemoryFlag(
-                default_variant="off",
-                variants={"on": True, "off": False},
-            ),
-            "enable_mcp_agent": InMemoryFlag(
-                default_variant="off",
-                variants={"on": True, "off": False},
-            ),
-            "dry_run_by_default": InMemoryFlag(
-                default_variant="on",
-                variants={"on": True, "off": False},
-            ),
-            "require_code_signatures": InMemoryFlag(
-                default_variant="on",
-                variants={"on": True, "off": False},
-            ),
-            "enable_vulnerability_blocking": InMemoryFlag(
-                default_variant="on",
-                variants={"on": True, "off": False},
-            ),
-        }
-    else:  # pragma: no cover - fallback when OpenFeature missing
-        DEFAULT_FLAGS = {}
+    DEFAULT_FLAGS = _DefaultFlagsAttribute()
+    # Built on first access so importing the module stays cheap.
+    _DEFAULT_FLAGS_CACHE: dict[str, InMemoryFlag[bool]] | None = None
+
+    @classmethod
+    def _default_flags(cls) -> dict[str, InMemoryFlag[bool]]:
+        """Return the built-in flag definitions, constructing them once."""
+        cached = cls._DEFAULT_FLAGS_CACHE
+        if cached is None:
+            cached = {
+                "allow_public_publish": InMemoryFlag(
+                    default_variant="off",
+                    variants={"on": True, "off": False},
+                ),
+                "require_slsa_provenance": InMemoryFlag(
+                    default_variant="on",
+                    variants={"on": True, "off": False},
+                ),
+                "enable_oci_distribution": InMemoryFlag(
+                    default_variant="off",
+                    variants={"on": True, "off": False},
+                ),
+                "enable_tuf_metadata": InMemoryFlag(
+                    default_variant="off",
+                    variants={"on": True, "off": False},
+                ),
+                "enable_mcp_agent": InMemoryFlag(
+                    default_variant="off",
+                    variants={"on": True, "off": False},
+                ),
+                "dry_run_by_default": InMemoryFlag(
+                    default_variant="on",
+                    variants={"on": True, "off": False},
+                ),
+                "require_code_signatures": InMemoryFlag(
+                    default_variant="on",
+                    variants={"on": True, "off": False},
+                ),
+                "enable_vulnerability_blocking": InMemoryFlag(
+                    default_variant="on",
+                    variants={"on": True, "off": False},
+                ),
+            }
+            cls._DEFAULT_FLAGS_CACHE = cached
+        return cached
 
     def __init__(self, flags: dict[str, Any] | None = None):
         """Initialize feature flags.
@@ -76,17 +118,23 @@ class FeatureFlags:
             flags: Custom flag definitions (overrides defaults)
         """
         self._initialized: bool = False
+        self._bool_cache: dict[Hashable, bool] = {}
+        self._string_cache: dict[Hashable, str] = {}
 
         if not OPENFEATURE_AVAILABLE:
             return
 
-        # Merge custom flags with defaults
-        all_flags = self.DEFAULT_FLAGS.copy()
+        # Merge custom flags with defaults, dropping None values (from missing
+        # imports) so they also mask the corresponding default. Without
+        # overrides the shared defaults are handed over as-is, uncopied.
+        all_flags: dict[str, Any] = type(self)._default_flags()
         if flags:
-            all_flags.update(flags)
-
-        # Remove None values (from missing imports)
-        all_flags = {k: v for k, v in all_flags.items() if v is not None}
+            all_flags = dict(all_flags)
+            for key, flag in flags.items():
+                if flag is None:
+                    all_flags.pop(key, None)
+                else:
+                    all_flags[key] = flag
 
         # Set up in-memory provider with default flags
         provider = InMemoryProvider(all_flags)
@@ -102,6 +150,29 @@ class FeatureFlags:
             )
         return api.get_client()
 
+    @property
+    def uses_environment_fallback(self) -> bool:
+        """Whether lookups read ``CHIRON_FEATURE_*`` instead of a provider."""
+        return not OPENFEATURE_AVAILABLE or not self._initialized
+
+    def clear_cache(self) -> None:
+        """Forget memoized provider evaluations (e.g. after flipping a flag)."""
+        self._bool_cache.clear()
+        self._string_cache.clear()
+
+    @staticmethod
+    def _cache_key(
+        flag_key: str, default: Any, context: dict[str, Any] | None
+    ) -> Hashable | None:
+        """Return the memoization key for an evaluation, or None if unhashable."""
+        if not context:
+            return (flag_key, default, None)
+        try:
+            frozen = frozenset(context.items())
+        except TypeError:
+            return None
+        return (flag_key, default, frozen)
+
     def get_boolean(
         self,
         flag_key: str,
@@ -119,14 +190,21 @@ class FeatureFlags:
             Boolean flag value
         """
         if not OPENFEATURE_AVAILABLE or not self._initialized:
-            env_key = f"CHIRON_FEATURE_{flag_key.upper()}"
-            value = os.getenv(env_key)
-            if value is None:
-                return default
-            return value.lower() in {"true", "1", "yes", "on"}
+            value = _read_env_bool(flag_key)
+            return default if value is None else value
+
+        key = self._cache_key(flag_key, default, context)
+        if key is not None:
+            try:
+                return self._bool_cache[key]
+            except KeyError:
+                pass
 
         eval_context = EvaluationContext(**context) if context else None
-        return bool(self.client.get_boolean_value(flag_key, default, eval_context))
+        result = bool(self.client.get_boolean_value(flag_key, default, eval_context))
+        if key is not None:
+            self._bool_cache[key] = result
+        return result
 
     def get_string(
         self, flag_key: str, default: str = "", context: dict[str, Any] | None = None
@@ -142,11 +220,21 @@ class FeatureFlags:
             String flag value
         """
         if not OPENFEATURE_AVAILABLE or not self._initialized:
-            env_key = f"CHIRON_FEATURE_{flag_key.upper()}"
-            return os.getenv(env_key, default)
+            raw = _read_env_flag(flag_key)
+            return default if raw is None else raw
+
+        key = self._cache_key(flag_key, default, context)
+        if key is not None:
+            try:
+                return self._string_cache[key]
+            except KeyError:
+                pass
 
         eval_context = EvaluationContext(**context) if context else None
-        return str(self.client.get_string_value(flag_key, default, eval_context))
+        result = str(self.client.get_string_value(flag_key, default, eval_context))
+        if key is not None:
+            self._string_cache[key] = result
+        return result
 
     def is_enabled(self, flag_key: str, context: dict[str, Any] | None = None) -> bool:
         """Check if a feature flag is enabled.
@@ -160,11 +248,21 @@ class FeatureFlags:
         Returns:
             True if flag is enabled, False otherwise
         """
+        # Inline get_boolean's hot paths (env fallback and memoized provider
+        # hits) so routine checks skip the extra call frame.
+        if not OPENFEATURE_AVAILABLE or not self._initialized:
+            return _read_env_bool(flag_key) is True
+        if not context:
+            try:
+                return self._bool_cache[(flag_key, False, None)]
+            except KeyError:
+                pass
         return self.get_boolean(flag_key, False, context)
 
 
 # Global feature flags instance
 _feature_flags: FeatureFlags | None = None
+_feature_flags_lock = threading.Lock()
 
 
 def get_feature_flags() -> FeatureFlags:
@@ -174,9 +272,15 @@ def get_feature_flags() -> FeatureFlags:
         FeatureFlags instance
     """
     global _feature_flags
-    if _feature_flags is None:
-        _feature_flags = FeatureFlags()
-    return _feature_flags
+    flags = _feature_flags
+    if flags is not None:
+        return flags
+    # Construction registers a global OpenFeature provider, so make sure only
+    # one thread ever performs it.
+    with _feature_flags_lock:
+        if _feature_flags is None:
+            _feature_flags = FeatureFlags()
+        return _feature_flags
 
 
 def is_feature_enabled(flag_key: str, context: dict[str, Any] | None = None) -> bool:
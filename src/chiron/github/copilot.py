@@ -10,6 +10,7 @@ import json
 import os
 import shutil
 import subprocess
+import time
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -25,7 +26,53 @@ COPILOT_INDICATOR_KEYS: tuple[str, ...] = (
     "COPILOT_AGENT_VERSION",
     "COPILOT_WORKSPACE_ID",
 )
+_COPILOT_INDICATOR_SET = frozenset(COPILOT_INDICATOR_KEYS)
 _DEFAULT_WORKFLOW_PATH = Path(".github/workflows/copilot-setup-steps.yml")
+_UV_SYNC_ALL_DEV: tuple[str, ...] = ("sync", "--all-extras", "--dev")
+_POSIX_EXPORTS = "\n".join(
+    [
+        f"export {COPILOT_DISABLE_ENV_VAR}=1",
+        "unset PIP_NO_INDEX",
+        "unset PIP_FIND_LINKS",
+    ]
+)
+_POWERSHELL_EXPORTS = "\n".join(
+    [
+        f'$Env:{COPILOT_DISABLE_ENV_VAR} = "1"',
+        "Remove-Item Env:PIP_NO_INDEX -ErrorAction SilentlyContinue",
+        "Remove-Item Env:PIP_FIND_LINKS -ErrorAction SilentlyContinue",
+    ]
+)
+_SHELL_EXPORTS: dict[str, str] = {
+    "bash": _POSIX_EXPORTS,
+    "zsh": _POSIX_EXPORTS,
+    "sh": _POSIX_EXPORTS,
+    "fish": "\n".join(
+        [
+            f"set -gx {COPILOT_DISABLE_ENV_VAR} 1",
+            "set -e PIP_NO_INDEX",
+            "set -e PIP_FIND_LINKS",
+        ]
+    ),
+    "powershell": _POWERSHELL_EXPORTS,
+    "pwsh": _POWERSHELL_EXPORTS,
+    "cmd": "\r\n".join(
+        [
+            f"set {COPILOT_DISABLE_ENV_VAR}=1",
+            "set PIP_NO_INDEX=",
+            "set PIP_FIND_LINKS=",
+        ]
+    ),
+}
+_FALSY_ENV_VALUES = frozenset({"0", "false", ""})
+_STATUS_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
+# (PATH snapshot, resolved uv executable); refreshed whenever PATH changes or
+# the executable disappears. Misses are never cached, so a later install is seen.
+_UV_PATH_CACHE: tuple[str | None, str] | None = None
+# Workflow path -> (monotonic timestamp, exists), reused for a few seconds so
+# repeated status polls do not stat the workflow file every time.
+_WORKFLOW_EXISTS_CACHE: dict[Path, tuple[float, bool]] = {}
+_WORKFLOW_EXISTS_TTL = 5.0
 
 
 @dataclass(slots=True)
@@ -74,9 +121,23 @@ class CopilotProvisioningError(RuntimeError):
     """Raised when environment preparation fails."""
 
 
-def _normalise_env(env: Mapping[str, str] | None = None) -> dict[str, str]:
+def _is_str_dict(env: Mapping[str, str]) -> bool:
+    return isinstance(env, dict) and all(type(v) is str for v in env.values())
+
+
+def _read_env(env: Mapping[str, str] | None = None) -> Mapping[str, str]:
+    if env is None:
+        return os.environ
+    if _is_str_dict(env):
+        return env
+    return {str(k): str(v) for k, v in env.items()}
+
+
+def _mutable_env(env: Mapping[str, str] | None = None) -> dict[str, str]:
     if env is None:
         return dict(os.environ)
+    if _is_str_dict(env):
+        return dict(env)
     return {str(k): str(v) for k, v in env.items()}
 
 
@@ -93,21 +154,54 @@ def detect_agent_environment(
         environment variable names that hinted at the Copilot agent.
     """
 
-    data = _normalise_env(env)
+    data = _read_env(env)
 
-    indicators = [key for key in COPILOT_INDICATOR_KEYS if key in data and data[key]]
-    if indicators:
-        return True, tuple(indicators)
+    present = _COPILOT_INDICATOR_SET & data.keys()
+    if present:
+        indicators = tuple(
+            key for key in COPILOT_INDICATOR_KEYS if key in present and data[key]
+        )
+        if indicators:
+            return True, indicators
 
     # Fallback heuristic: running inside GitHub Actions with any COPILOT_* key.
     if data.get("GITHUB_ACTIONS") == "true":
-        dynamic_indicators = [key for key in data if key.startswith("COPILOT_")]
+        # The substring test runs in C and rejects almost every key without a
+        # method call; startswith then confirms the prefix for the few left.
+        dynamic_indicators = [
+            key for key in data if "COPILOT_" in key and key.startswith("COPILOT_")
+        ]
         if dynamic_indicators:
             return True, tuple(dynamic_indicators)
 
     return False, ()
 
 
+def _is_truthy_env(value: str | None) -> bool:
+    return value is not None and value.lower() not in _FALSY_ENV_VALUES
+
+
+def _cached_which_uv() -> str | None:
+    global _UV_PATH_CACHE
+    path_env = os.environ.get("PATH")
+    cached = _UV_PATH_CACHE
+    if cached is not None and cached[0] == path_env and os.path.exists(cached[1]):
+        return cached[1]
+    resolved = shutil.which("uv")
+    _UV_PATH_CACHE = None if resolved is None else (path_env, resolved)
+    return resolved
+
+
+def _workflow_exists(workflow: Path) -> bool:
+    now = time.monotonic()
+    cached = _WORKFLOW_EXISTS_CACHE.get(workflow)
+    if cached is not None and now - cached[0] < _WORKFLOW_EXISTS_TTL:
+        return cached[1]
+    exists = workflow.exists()
+    _WORKFLOW_EXISTS_CACHE[workflow] = (now, exists)
+    return exists
+
+
 def _build_uv_command(
     uv_executable: str,
     *,
@@ -116,6 +210,9 @@ def _build_uv_command(
     include_dev: bool,
     additional_args: Sequence[str] | None,
 ) -> list[str]:
+    if all_extras and include_dev and not additional_args:
+        return [uv_executable, *_UV_SYNC_ALL_DEV]
+
     command = [uv_executable, "sync"]
 
     if all_extras:
@@ -135,18 +232,39 @@ def _build_uv_command(
     return command
 
 
-def _apply_env_overrides(
-    environment: dict[str, str],
+def _plan_env_overrides(
+    environment: Mapping[str, str],
     clear_offline_overrides: bool,
 ) -> dict[str, str | None]:
     overrides: dict[str, str | None] = {COPILOT_DISABLE_ENV_VAR: "1"}
-    environment[COPILOT_DISABLE_ENV_VAR] = "1"
 
     if clear_offline_overrides:
         for key in ("PIP_NO_INDEX", "PIP_FIND_LINKS"):
             if key in environment:
                 overrides[key] = None
-                environment.pop(key, None)
+
+    return overrides
+
+
+def _overrides_in_effect(
+    environment: Mapping[str, str], overrides: Mapping[str, str | None]
+) -> bool:
+    return all(
+        key not in environment if value is None else environment.get(key) == value
+        for key, value in overrides.items()
+    )
+
+
+def _apply_env_overrides(
+    environment: dict[str, str],
+    clear_offline_overrides: bool,
+) -> dict[str, str | None]:
+    overrides = _plan_env_overrides(environment, clear_offline_overrides)
+    for key, value in overrides.items():
+        if value is None:
+            environment.pop(key, None)
+        else:
+            environment[key] = value
 
     return overrides
 
@@ -160,20 +278,19 @@ def collect_status(
     """Collect Copilot readiness metadata for the given workspace."""
 
     root = workspace_root or Path.cwd()
-    data = _normalise_env(env)
+    data = _read_env(env)
     workflow = workflow_path or (root / _DEFAULT_WORKFLOW_PATH)
 
     is_agent, indicators = detect_agent_environment(data)
 
     wheelhouse_disabled = bool(data.get(COPILOT_DISABLE_ENV_VAR))
-    workflow_present = workflow.exists()
-    uv_available = shutil.which("uv") is not None
+    workflow_present = _workflow_exists(workflow)
+    uv_available = _cached_which_uv() is not None
 
     pip_find_links = data.get("PIP_FIND_LINKS")
     pip_no_index = data.get("PIP_NO_INDEX")
-    pip_overrides_active = any(
-        value and str(value).lower() not in {"0", "false"}
-        for value in (pip_find_links, pip_no_index)
+    pip_overrides_active = _is_truthy_env(pip_find_links) or _is_truthy_env(
+        pip_no_index
     )
 
     return CopilotStatus(
@@ -205,8 +322,8 @@ def prepare_environment(
     """Run ``uv sync`` with the right overrides for the Copilot agent."""
 
     root = workspace_root or Path.cwd()
-    data = _normalise_env(env)
-    uv_executable = uv_path or shutil.which("uv")
+    data = _read_env(env)
+    uv_executable = uv_path or _cached_which_uv()
 
     if not uv_executable:
         return PrepareResult(
@@ -224,7 +341,7 @@ def prepare_environment(
         include_dev=include_dev,
         additional_args=additional_args,
     )
-    env_overrides = _apply_env_overrides(data, clear_offline_overrides)
+    env_overrides = _plan_env_overrides(data, clear_offline_overrides)
 
     result = PrepareResult(
         command=tuple(args),
@@ -236,10 +353,17 @@ def prepare_environment(
     if dry_run:
         return result
 
+    # Inherit the parent environment untouched when it already carries every
+    # override; only build a private copy when something has to change.
+    child_env: dict[str, str] | None = None
+    if env is not None or not _overrides_in_effect(data, env_overrides):
+        child_env = _mutable_env(env)
+        _apply_env_overrides(child_env, clear_offline_overrides)
+
     completed = subprocess.run(  # noqa: S603 - arguments constructed above
         args,
         cwd=root,
-        env=data,
+        env=child_env,
         check=False,
         timeout=timeout,
     )
@@ -260,47 +384,13 @@ def prepare_environment(
 def generate_env_exports(shell: str = "bash") -> str:
     """Return shell-specific commands to configure the Copilot environment."""
 
-    shell_normalised = shell.lower()
-    if shell_normalised in {"bash", "zsh", "sh"}:
-        return "\n".join(
-            [
-                f"export {COPILOT_DISABLE_ENV_VAR}=1",
-                "unset PIP_NO_INDEX",
-                "unset PIP_FIND_LINKS",
-            ]
-        )
-
-    if shell_normalised == "fish":
-        return "\n".join(
-            [
-                f"set -gx {COPILOT_DISABLE_ENV_VAR} 1",
-                "set -e PIP_NO_INDEX",
-                "set -e PIP_FIND_LINKS",
-            ]
-        )
-
-    if shell_normalised in {"powershell", "pwsh"}:
-        return "\n".join(
-            [
-                f'$Env:{COPILOT_DISABLE_ENV_VAR} = "1"',
-                "Remove-Item Env:PIP_NO_INDEX -ErrorAction SilentlyContinue",
-                "Remove-Item Env:PIP_FIND_LINKS -ErrorAction SilentlyContinue",
-            ]
-        )
-
-    if shell_normalised == "cmd":
-        return "\r\n".join(
-            [
-                f"set {COPILOT_DISABLE_ENV_VAR}=1",
-                "set PIP_NO_INDEX=",
-                "set PIP_FIND_LINKS=",
-            ]
-        )
-
-    raise CopilotProvisioningError(f"Unsupported shell: {shell}")
+    try:
+        return _SHELL_EXPORTS[shell.lower()]
+    except KeyError:
+        raise CopilotProvisioningError(f"Unsupported shell: {shell}") from None
 
 
 def format_status_json(status: CopilotStatus) -> str:
     """Return a formatted JSON string for the given status."""
 
-    return json.dumps(status.as_dict(), indent=2, sort_keys=True)
+    return _STATUS_ENCODER.encode(status.as_dict())
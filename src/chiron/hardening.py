@@ -143,10 +143,15 @@ def install_thinc_seed_guard() -> bool:
 
     try:
         thinc_util = importlib.import_module("thinc.util")
-    except Exception:  # pragma: no cover - optional dependency
+    except Exception as exc:  # pragma: no cover - optional dependency
         if _HOOK_INSTALLED:
             return False
 
+        # Without thinc there is nothing to patch later, so skip the meta path
+        # finder rather than taxing every subsequent import with it.
+        if isinstance(exc, ModuleNotFoundError) and exc.name == "thinc":
+            return False
+
         finder = _ThincSeedGuardFinder()
         finder.install()
         _HOOK_INSTALLED = True
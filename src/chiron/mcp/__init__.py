@@ -1,5 +1,13 @@
 """MCP agent mode package."""
 
-from chiron.mcp.server import MCPServer, create_mcp_server_config
+from chiron.mcp.server import (
+    MCPServer,
+    create_mcp_server_config,
+    create_mcp_server_config_json,
+)
 
-__all__ = ["MCPServer", "create_mcp_server_config"]
+__all__ = [
+    "MCPServer",
+    "create_mcp_server_config",
+    "create_mcp_server_config_json",
+]
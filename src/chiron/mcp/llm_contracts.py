@@ -5,6 +5,9 @@ from __future__ import annotations
 import json
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cache
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Protocol
 
 from chiron.mcp.server import MCPServer
@@ -45,6 +48,13 @@ class DeterministicLLMClient:
 
     def __init__(self, responses: dict[str, str]) -> None:
         self._responses = responses
+        # Responses are fixed, so decode each valid JSON payload exactly once.
+        self._parsed: dict[str, Any] = {}
+        for prompt, payload in responses.items():
+            try:
+                self._parsed[prompt] = json.loads(payload)
+            except json.JSONDecodeError:
+                continue
 
     def generate(self, prompt: str) -> str:
         try:
@@ -54,6 +64,16 @@ class DeterministicLLMClient:
                 f"No deterministic response configured for prompt: {prompt}"
             ) from exc
 
+    def generate_parsed(self, prompt: str) -> Any:
+        """Return the decoded JSON response for *prompt*.
+
+        The decoded object is shared between calls and must not be mutated.
+        """
+        try:
+            return self._parsed[prompt]
+        except KeyError:
+            return json.loads(self.generate(prompt))
+
 
 class LLMContractRunner:
     """Run contract scenarios using an LLM client to propose tool invocations."""
@@ -62,13 +82,16 @@ class LLMContractRunner:
         self.client = client
         self.server = server or MCPServer()
 
-    def run(self, scenario: ContractScenario) -> ContractExecution:
-        payload = self.client.generate(scenario.prompt)
+    def _plan(self, scenario: ContractScenario) -> tuple[str, dict[str, Any]]:
+        generate_parsed = getattr(self.client, "generate_parsed", None)
         try:
-            data = json.loads(payload)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+            if generate_parsed is not None:
+                data = generate_parsed(scenario.prompt)
+            else:
+                data = json.loads(self.client.generate(scenario.prompt))
+        except json.JSONDecodeError as exc:
             raise ContractAssertionError(
-                f"LLM response is not valid JSON: {payload}"
+                f"LLM response is not valid JSON: {exc.doc}"
             ) from exc
 
         tool = data.get("tool")
@@ -79,7 +102,16 @@ class LLMContractRunner:
         if not isinstance(arguments, dict):
             raise ContractAssertionError("LLM arguments must be a JSON object")
 
-        response = self.server.execute_tool(tool, arguments)
+        # Copy so the stored execution never aliases a client's decoded response.
+        return tool, dict(arguments)
+
+    @staticmethod
+    def _check(
+        scenario: ContractScenario,
+        tool: str,
+        arguments: dict[str, Any],
+        response: dict[str, Any],
+    ) -> ContractExecution:
         missing = scenario.expected_keys - response.keys()
         if missing:
             raise ContractAssertionError(
@@ -93,14 +125,43 @@ class LLMContractRunner:
             response=response,
         )
 
-    def run_all(self, scenarios: Iterable[ContractScenario]) -> list[ContractExecution]:
-        return [self.run(scenario) for scenario in scenarios]
+    def run(self, scenario: ContractScenario) -> ContractExecution:
+        tool, arguments = self._plan(scenario)
+        response = self.server.execute_tool(tool, arguments)
+        return self._check(scenario, tool, arguments, response)
 
+    def run_all(self, scenarios: Iterable[ContractScenario]) -> list[ContractExecution]:
+        # Plan every scenario up front so malformed LLM output fails before any
+        # tool runs. Consecutive scenarios sharing a tool then run as one batch,
+        # in scenario order, and each batch is checked before the next starts.
+        planned = [(scenario, *self._plan(scenario)) for scenario in scenarios]
+        execute_batch = getattr(self.server, "execute_batch", None)
+
+        executions: list[ContractExecution] = []
+        for tool, group in groupby(planned, key=itemgetter(1)):
+            entries = list(group)
+            arguments_list = [arguments for _, _, arguments in entries]
+            responses: Iterable[dict[str, Any]]
+            if execute_batch is not None:
+                responses = execute_batch(tool, arguments_list)
+            else:
+                # Lazily, so a failed check stops the remaining invocations.
+                responses = (
+                    self.server.execute_tool(tool, arguments)
+                    for arguments in arguments_list
+                )
+            executions.extend(
+                self._check(scenario, tool, arguments, response)
+                for (scenario, _, arguments), response in zip(
+                    entries, responses, strict=True
+                )
+            )
+        return executions
 
-def default_scenarios() -> list[ContractScenario]:
-    """Default scenarios covering key MCP tools."""
 
-    return [
+@cache
+def _default_scenarios() -> tuple[ContractScenario, ...]:
+    return (
         ContractScenario(
             prompt=(
                 "Select the health check tool and invoke it with no arguments, "
@@ -117,25 +178,39 @@ def default_scenarios() -> list[ContractScenario]:
             expected_keys={"status", "message", "version"},
             description="Verify wheelhouse orchestration contract",
         ),
+    )
+
+
+# Deterministic tool calls answering each default scenario, in the same order.
+_DEFAULT_RESPONSES: tuple[str, ...] = (
+    json.dumps({"tool": "chiron_health_check", "arguments": {}}),
+    json.dumps({"tool": "chiron_build_wheelhouse", "arguments": {"dry_run": True}}),
+)
+
+
+def default_scenarios() -> list[ContractScenario]:
+    """Default scenarios covering key MCP tools."""
+
+    # Scenarios are mutable, so callers get their own copies of the cached set.
+    return [
+        ContractScenario(
+            prompt=scenario.prompt,
+            expected_keys=set(scenario.expected_keys),
+            description=scenario.description,
+        )
+        for scenario in _default_scenarios()
     ]
 
 
+@cache
 def default_llm_client() -> DeterministicLLMClient:
     """Return a deterministic client suitable for tests and CI."""
 
     responses = {
-        default_scenarios()[0].prompt: json.dumps(
-            {
-                "tool": "chiron_health_check",
-                "arguments": {},
-            }
-        ),
-        default_scenarios()[1].prompt: json.dumps(
-            {
-                "tool": "chiron_build_wheelhouse",
-                "arguments": {"dry_run": True},
-            }
-        ),
+        scenario.prompt: payload
+        for scenario, payload in zip(
+            _default_scenarios(), _DEFAULT_RESPONSES, strict=True
+        )
     }
     return DeterministicLLMClient(responses)
 
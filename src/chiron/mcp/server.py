@@ -6,14 +6,26 @@ as tools for AI assistants and automation systems.
 
 from __future__ import annotations
 
+import importlib
 import json
 import logging
-from collections.abc import Callable
+import sys
+import weakref
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType, ModuleType
 from typing import TYPE_CHECKING, Any
 
 from chiron import __version__
 
+__all__ = [
+    "MCPServer",
+    "create_mcp_server_config",
+    "create_mcp_server_config_json",
+    "invalidate_feature_flag_snapshot",
+]
+
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from chiron.features import FeatureFlags
 
@@ -26,10 +38,99 @@ except ImportError:  # pragma: no cover - fallback when features unavailable
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _jsonschema() -> ModuleType | None:
+    """Import ``jsonschema`` on first use so server start-up stays cheap."""
+    try:
+        return importlib.import_module("jsonschema")
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+
+# Optional subsystems that failed to import. Python does not cache failed
+# imports, so without this every tool call would repeat the sys.path search.
+_UNAVAILABLE_MODULES: set[str] = set()
+
+
+def _import_attr(module_name: str, attr: str) -> Any:
+    """Return ``module_name.attr``, raising ImportError when unavailable."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        if module_name in _UNAVAILABLE_MODULES:
+            raise ImportError(f"No module named {module_name!r}")
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            _UNAVAILABLE_MODULES.add(module_name)
+            raise
+    try:
+        return getattr(module, attr)
+    except AttributeError as exc:
+        raise ImportError(f"cannot import name {attr!r} from {module_name!r}") from exc
+
+
+# Flags reported by the ``chiron_get_feature_flags`` tool, in response order.
+_FLAG_KEYS = (
+    "allow_public_publish",
+    "require_slsa_provenance",
+    "enable_oci_distribution",
+    "enable_mcp_agent",
+    "dry_run_by_default",
+)
+
+# Bumped by invalidate_feature_flag_snapshot() to force flags to be re-read.
+_FLAG_SNAPSHOT_VERSION = 0
+
+
+# Every possible flag report, indexed by a bitmask with bit ``i`` set when
+# ``_FLAG_KEYS[i]`` is enabled.
+_FLAG_RESPONSES: tuple[Mapping[str, bool], ...] = tuple(
+    MappingProxyType({key: bool(mask >> i & 1) for i, key in enumerate(_FLAG_KEYS)})
+    for mask in range(1 << len(_FLAG_KEYS))
+)
+
+
+# (flags instance, snapshot version, report) for the last provider-backed
+# evaluation; the instance is held weakly so the cache never keeps it alive.
+_FLAG_SNAPSHOT: tuple[weakref.ref[FeatureFlags], int, Mapping[str, bool]] | None = None
+
+
+def _compute_flag_snapshot(flags: FeatureFlags) -> Mapping[str, bool]:
+    """Evaluate the flags reported by the MCP tool, once per instance/version.
+
+    Flags read from the ``CHIRON_FEATURE_*`` environment fallback are evaluated
+    on every call so runtime changes to the environment are picked up.
+    """
+    global _FLAG_SNAPSHOT
+    cached = _FLAG_SNAPSHOT
+    if (
+        cached is not None
+        and cached[1] == _FLAG_SNAPSHOT_VERSION
+        and cached[0]() is flags
+    ):
+        return cached[2]
+
+    is_enabled = flags.is_enabled
+    mask = 0
+    for i, key in enumerate(_FLAG_KEYS):
+        if is_enabled(key):
+            mask |= 1 << i
+    snapshot = _FLAG_RESPONSES[mask]
+    if not flags.uses_environment_fallback:
+        _FLAG_SNAPSHOT = (weakref.ref(flags), _FLAG_SNAPSHOT_VERSION, snapshot)
+    return snapshot
+
+
+def invalidate_feature_flag_snapshot() -> None:
+    """Make the next ``chiron_get_feature_flags`` call re-evaluate every flag."""
+    global _FLAG_SNAPSHOT_VERSION
+    _FLAG_SNAPSHOT_VERSION += 1
+
+
 class MCPServer:
     """MCP server for Chiron operations."""
 
-    TOOLS = [
+    TOOLS: list[dict[str, Any]] = [
         {
             "name": "chiron_build_wheelhouse",
             "description": "Build a wheelhouse bundle with wheels for multiple platforms",
@@ -145,6 +246,32 @@ class MCPServer:
         },
     ]
 
+    _TOOL_NAMES: tuple[str, ...] = tuple(tool["name"] for tool in TOOLS)
+    _TOOL_SCHEMAS: dict[str, Any] = {
+        tool["name"]: tool["inputSchema"] for tool in TOOLS
+    }
+
+    # Fixed leading fields of the dry-run responses; handlers append the
+    # caller-supplied values.
+    _DRY_RUN_WHEELHOUSE: Mapping[str, Any] = MappingProxyType(
+        {
+            "status": "dry_run",
+            "message": "Would build wheelhouse",
+            "version": __version__,
+        }
+    )
+    _DRY_RUN_AIRGAP: Mapping[str, Any] = MappingProxyType(
+        {
+            "status": "dry_run",
+            "message": "Would create air-gap bundle",
+            "version": __version__,
+        }
+    )
+
+    # Tool name -> validator compiled from its inputSchema (None when the
+    # schema cannot be validated), built once per process on first use.
+    _VALIDATORS: dict[str, Any] = {}
+
     def __init__(self, policy_check: bool = True):
         """Initialize MCP server.
 
@@ -152,15 +279,88 @@ class MCPServer:
             policy_check: Whether to enforce policy checks on operations
         """
         self.policy_check = policy_check
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "chiron_build_wheelhouse": self._build_wheelhouse,
+            "chiron_verify_artifacts": self._verify_artifacts,
+            "chiron_create_airgap_bundle": self._create_airgap_bundle,
+            "chiron_check_policy": self._check_policy,
+            "chiron_health_check": self._health_check,
+            "chiron_get_feature_flags": self._get_feature_flags,
+        }
+        # Tool name -> (handler, validator), filled on first use of each tool
+        # so repeat calls resolve everything with a single dict probe.
+        self._routes: dict[
+            str, tuple[Callable[[dict[str, Any]], dict[str, Any]], Any]
+        ] = {}
 
-    def list_tools(self) -> list[dict[str, Any]]:
+    def list_tools(self) -> Sequence[Mapping[str, Any]]:
         """List available tools.
 
+        The definitions are shared by every server instance and must be
+        treated as read-only; copy them before making changes.
+
         Returns:
             List of tool definitions
         """
         return self.TOOLS
 
+    def _unknown_tool(self, tool_name: str) -> dict[str, Any]:
+        """Build the error payload returned for unknown tools."""
+        return {
+            "error": f"Unknown tool: {tool_name}",
+            "available_tools": list(self._TOOL_NAMES),
+        }
+
+    @classmethod
+    def _argument_validator(cls, tool_name: str) -> Any:
+        """Return the compiled argument validator for *tool_name*, if any."""
+        try:
+            return cls._VALIDATORS[tool_name]
+        except KeyError:
+            pass
+
+        validator = None
+        jsonschema = _jsonschema()
+        schema = cls._TOOL_SCHEMAS.get(tool_name)
+        if jsonschema is not None and schema is not None:
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+
+        cls._VALIDATORS[tool_name] = validator
+        return validator
+
+    def _route(
+        self, tool_name: str
+    ) -> tuple[Callable[[dict[str, Any]], dict[str, Any]], Any] | None:
+        """Return the handler and argument validator for *tool_name*."""
+        route = self._routes.get(tool_name)
+        if route is None:
+            handler = self._handlers.get(tool_name)
+            if handler is None:
+                return None
+            route = (handler, self._argument_validator(tool_name))
+            self._routes[tool_name] = route
+        return route
+
+    @staticmethod
+    def _invoke(
+        tool_name: str,
+        handler: Callable[[dict[str, Any]], dict[str, Any]],
+        validator: Any,
+        arguments: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Validate *arguments* against the tool schema, then run *handler*."""
+        if validator is not None:
+            error = next(validator.iter_errors(arguments), None)
+            if error is not None:
+                return {
+                    "status": "error",
+                    "message": f"Invalid arguments for {tool_name}: {error.message}",
+                }
+
+        return handler(arguments)
+
     def execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool with given arguments.
 
@@ -171,23 +371,34 @@ class MCPServer:
         Returns:
             Tool execution result
         """
-        handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
-            "chiron_build_wheelhouse": self._build_wheelhouse,
-            "chiron_verify_artifacts": self._verify_artifacts,
-            "chiron_create_airgap_bundle": self._create_airgap_bundle,
-            "chiron_check_policy": self._check_policy,
-            "chiron_health_check": self._health_check,
-            "chiron_get_feature_flags": self._get_feature_flags,
-        }
+        route = self._routes.get(tool_name) or self._route(tool_name)
+        if route is None:
+            return self._unknown_tool(tool_name)
 
-        handler = handlers.get(tool_name)
-        if handler is None:
-            return {
-                "error": f"Unknown tool: {tool_name}",
-                "available_tools": [t["name"] for t in self.TOOLS],
-            }
+        return self._invoke(tool_name, route[0], route[1], arguments)
 
-        return handler(arguments)
+    def execute_batch(
+        self, tool_name: str, arguments_list: Iterable[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Execute one tool for several argument sets, resolving it only once.
+
+        Args:
+            tool_name: Name of the tool to execute
+            arguments_list: Argument mappings, one per invocation
+
+        Returns:
+            Tool execution results in the order of ``arguments_list``
+        """
+        route = self._route(tool_name)
+        if route is None:
+            return [self._unknown_tool(tool_name) for _ in arguments_list]
+
+        handler, validator = route
+        invoke = self._invoke
+        return [
+            invoke(tool_name, handler, validator, arguments)
+            for arguments in arguments_list
+        ]
 
     def _build_wheelhouse(self, args: dict[str, Any]) -> dict[str, Any]:
         """Build wheelhouse bundle with real implementation."""
@@ -198,16 +409,14 @@ class MCPServer:
 
         if dry_run:
             return {
-                "status": "dry_run",
-                "message": "Would build wheelhouse",
-                "version": __version__,
+                **self._DRY_RUN_WHEELHOUSE,
                 "output_dir": output_dir,
                 "with_sbom": with_sbom,
                 "with_signatures": with_signatures,
             }
 
         try:
-            from chiron.deps.bundler import WheelhouseBundler
+            WheelhouseBundler = _import_attr("chiron.deps.bundler", "WheelhouseBundler")
 
             wheelhouse_path = Path(output_dir)
             if not wheelhouse_path.exists():
@@ -254,9 +463,11 @@ class MCPServer:
             }
 
         try:
-            from chiron.deps.verify import (
-                check_cli_commands,
-                check_script_imports,
+            check_cli_commands = _import_attr(
+                "chiron.deps.verify", "check_cli_commands"
+            )
+            check_script_imports = _import_attr(
+                "chiron.deps.verify", "check_script_imports"
             )
 
             # Perform verification checks
@@ -297,16 +508,14 @@ class MCPServer:
 
         if dry_run:
             return {
-                "status": "dry_run",
-                "message": "Would create air-gap bundle",
-                "version": __version__,
+                **self._DRY_RUN_AIRGAP,
                 "output": output,
                 "include_extras": include_extras,
                 "include_security": include_security,
             }
 
         try:
-            from chiron.deps.bundler import WheelhouseBundler
+            WheelhouseBundler = _import_attr("chiron.deps.bundler", "WheelhouseBundler")
 
             # Assume a wheelhouse directory exists
             wheelhouse_path = Path("wheelhouse")
@@ -348,7 +557,7 @@ class MCPServer:
         config_path = args.get("config_path")
 
         try:
-            from chiron.deps.policy import DependencyPolicy
+            DependencyPolicy = _import_attr("chiron.deps.policy", "DependencyPolicy")
 
             # Load policy configuration
             if config_path:
@@ -409,16 +618,8 @@ class MCPServer:
         if resolver is None:
             return {"error": "Feature flags module not available"}
 
-        flags = resolver()
-        return {
-            "flags": {
-                "allow_public_publish": flags.is_enabled("allow_public_publish"),
-                "require_slsa_provenance": flags.is_enabled("require_slsa_provenance"),
-                "enable_oci_distribution": flags.is_enabled("enable_oci_distribution"),
-                "enable_mcp_agent": flags.is_enabled("enable_mcp_agent"),
-                "dry_run_by_default": flags.is_enabled("dry_run_by_default"),
-            }
-        }
+        snapshot = _compute_flag_snapshot(resolver())
+        return {"flags": dict(snapshot)}
 
 
 def create_mcp_server_config() -> dict[str, Any]:
@@ -441,6 +642,19 @@ def create_mcp_server_config() -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1)
+def create_mcp_server_config_json() -> str:
+    """Return the MCP server configuration serialised as indented JSON.
+
+    The configuration is constant for a given installation, so the encoded
+    form is built once and reused.
+
+    Returns:
+        MCP server configuration as a JSON string
+    """
+    return json.dumps(create_mcp_server_config(), indent=2)
+
+
 if __name__ == "__main__":
     # Example usage
     server = MCPServer()
@@ -453,4 +667,4 @@ if __name__ == "__main__":
 
     print("\n" + "=" * 60)
     print("\nMCP Server Configuration:")
-    print(json.dumps(create_mcp_server_config(), indent=2))
+    print(create_mcp_server_config_json())
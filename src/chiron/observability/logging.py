@@ -6,11 +6,49 @@ import json
 import logging
 import os
 import socket
-from datetime import UTC, datetime
-from typing import Any
+import sys
+import time
+from types import ModuleType
+from typing import Any, TextIO, cast
+
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson_module
+except ModuleNotFoundError:  # pragma: no cover - optional serialisation speed-up
+    _orjson = None
+else:
+    _orjson = _orjson_module
 
 DEFAULT_LOG_LEVEL = "INFO"
 
+# LogRecord attributes that are either rendered explicitly or not worth
+# emitting as extra fields.
+_RESERVED_RECORD_KEYS = frozenset(
+    {
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "process",
+        "processName",
+        "exc_info",
+        "stack_info",
+    }
+)
+# Fields every payload starts with; record attributes never override them.
+_PAYLOAD_KEYS = frozenset(
+    {"timestamp", "level", "logger", "message", "service", "hostname", "run_mode"}
+)
+# Bound on distinct record layouts remembered by each formatter.
+_MAX_RECORD_SHAPES = 128
+# Stream encodings for which JSON bytes can bypass the text layer.
+_UTF8_NAMES = frozenset({"utf-8", "utf8"})
+
 
 class _JsonFormatter(logging.Formatter):
     """Emit JSON log records without requiring external dependencies."""
@@ -18,16 +56,72 @@ class _JsonFormatter(logging.Formatter):
     def __init__(self, service_name: str | None = None) -> None:
         super().__init__()
         self._service = service_name or "chiron"
-
-    def format(self, record: logging.LogRecord) -> str:  # noqa: D401 - stdlib signature
+        # Hostname and run mode are fixed for the life of the process, so
+        # resolve them once instead of per record.
+        self._hostname = socket.gethostname()
+        self._run_mode = os.getenv("CHIRON_RUN_MODE", "unknown")
+        self._static_fields: dict[str, Any] = {
+            "service": self._service,
+            "hostname": self._hostname,
+            "run_mode": self._run_mode,
+        }
+        self._last_second: tuple[int, str] = (-1, "")
+        self._extra_keys_by_shape: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def _extra_keys(self, shape: tuple[str, ...]) -> tuple[str, ...]:
+        """Return the record attributes emitted as extra fields, in order.
+
+        Records from the same call site share an attribute layout, so the
+        filtering is computed once per layout rather than once per record.
+        """
+        try:
+            return self._extra_keys_by_shape[shape]
+        except KeyError:
+            pass
+
+        keys = tuple(
+            key
+            for key in shape
+            if not key.startswith("_")
+            and key not in _RESERVED_RECORD_KEYS
+            and key not in _PAYLOAD_KEYS
+        )
+        if len(self._extra_keys_by_shape) >= _MAX_RECORD_SHAPES:
+            self._extra_keys_by_shape.clear()
+        self._extra_keys_by_shape[shape] = keys
+        return keys
+
+    def _timestamp(self, created: float) -> str:
+        """Render *created* exactly like ``datetime.isoformat()`` in UTC."""
+        seconds = int(created)
+        micros = round((created - seconds) * 1_000_000)
+        if micros >= 1_000_000:
+            seconds += 1
+            micros -= 1_000_000
+
+        # Records arrive in bursts within the same second, so reuse the
+        # formatted date/time prefix until the second changes.
+        cached_second, prefix = self._last_second
+        if cached_second != seconds:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._last_second = (seconds, prefix)
+
+        if micros:
+            return f"{prefix}.{micros:06d}+00:00"
+        return f"{prefix}+00:00"
+
+    def _payload(self, record: logging.LogRecord) -> dict[str, Any]:
+        msg = record.msg
+        # Structured call sites pass data via ``extra=`` and leave ``args``
+        # empty, in which case getMessage() would only return ``str(msg)``.
+        if record.args or not isinstance(msg, str):
+            msg = record.getMessage()
         payload: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
-            "service": self._service,
-            "hostname": socket.gethostname(),
-            "run_mode": os.getenv("CHIRON_RUN_MODE", "unknown"),
+            "message": msg,
+            **self._static_fields,
         }
 
         if record.exc_info:
@@ -35,28 +129,78 @@ class _JsonFormatter(logging.Formatter):
         if record.stack_info:
             payload["stack"] = record.stack_info
 
-        for key, value in record.__dict__.items():
-            if key.startswith("_") or key in payload:
-                continue
-            if key in {
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "process",
-                "processName",
-                "exc_info",
-                "stack_info",
-            }:
-                continue
-            payload[key] = value
-
-        return json.dumps(payload, ensure_ascii=False)
+        attributes = record.__dict__
+        for key in self._extra_keys(tuple(attributes)):
+            if key not in payload:
+                payload[key] = attributes[key]
+        return payload
+
+    def format(self, record: logging.LogRecord) -> str:  # noqa: D401 - stdlib signature
+        return self.format_bytes(record).decode("utf-8")
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Render *record* as UTF-8 encoded JSON.
+
+        With ``orjson`` installed the output is compact and non-finite floats
+        (``nan``/``inf``) are written as ``null``; the stdlib fallback keeps the
+        default ``json.dumps`` layout and emits them as ``NaN``/``Infinity``.
+        """
+        payload = self._payload(record)
+        if _orjson is not None:
+            try:
+                return cast(bytes, _orjson.dumps(payload))
+            except TypeError:
+                # orjson rejects some values json accepts (e.g. non-str keys or
+                # ints beyond 64 bits); let the stdlib encoder handle those.
+                pass
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class _JsonBytesHandler(logging.StreamHandler[TextIO]):
+    """Stream handler that writes JSON bytes straight to the stream's buffer.
+
+    Skips the text layer's per-record encode when the stream is UTF-8 and
+    exposes a binary ``buffer``; other streams use the standard string path.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = self.stream
+        formatter = self.formatter
+        buffer = getattr(stream, "buffer", None)
+        if (
+            buffer is None
+            or not isinstance(formatter, _JsonFormatter)
+            or (getattr(stream, "encoding", None) or "").lower() not in _UTF8_NAMES
+        ):
+            super().emit(record)
+            return
+
+        try:
+            data = formatter.format_bytes(record)
+            # Push out any text already queued on the wrapper so lines stay
+            # in order when other code writes to the same stream.
+            stream.flush()
+            buffer.write(data + b"\n")
+            buffer.flush()
+        except RecursionError:  # pragma: no cover - mirrors StreamHandler.emit
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Formatters keyed by (service name, run mode), reused across reconfiguration.
+_FORMATTER_CACHE: dict[tuple[str | None, str | None], _JsonFormatter] = {}
+# Handler installed by the most recent configure_logging() call.
+_configured_handler: logging.Handler | None = None
+
+
+def _formatter_for(service_name: str | None) -> _JsonFormatter:
+    """Return the shared formatter for *service_name* and the current run mode."""
+    key = (service_name, os.getenv("CHIRON_RUN_MODE"))
+    formatter = _FORMATTER_CACHE.get(key)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE[key] = _JsonFormatter(service_name=service_name)
+    return formatter
 
 
 def configure_logging(
@@ -77,14 +221,29 @@ def configure_logging(
         Configured root logger instance.
     """
 
+    global _configured_handler
+
     resolved_level = os.getenv("CHIRON_LOG_LEVEL", level).upper()
     root_logger = logging.getLogger()
-    root_logger.setLevel(resolved_level)
-    root_logger.handlers.clear()
-
-    handler = logging.StreamHandler()
-    handler.setFormatter(_JsonFormatter(service_name=service_name))
-    root_logger.addHandler(handler)
+    formatter = _formatter_for(service_name)
+
+    # Re-running with identical settings is common (tests, CLI sub-commands);
+    # leave the existing handler in place rather than rebuilding it.
+    handlers = root_logger.handlers
+    if (
+        len(handlers) == 1
+        and handlers[0] is _configured_handler
+        and handlers[0].formatter is formatter
+        and getattr(handlers[0], "stream", None) is sys.stderr
+        and logging.getLevelName(root_logger.level) == resolved_level
+    ):
+        logging.captureWarnings(True)
+        return root_logger
+
+    handler = _JsonBytesHandler()
+    handler.setFormatter(formatter)
+    logging.basicConfig(level=resolved_level, handlers=[handler], force=True)
+    _configured_handler = handler
 
     logging.captureWarnings(True)
     return root_logger
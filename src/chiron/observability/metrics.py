@@ -6,27 +6,31 @@ import importlib
 import logging
 import os
 from collections.abc import Mapping
+from functools import cache
+from typing import TYPE_CHECKING
 
 from opentelemetry import metrics
-from opentelemetry.metrics import Meter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import (
-    ConsoleMetricExporter,
-    MetricExporter,
-    PeriodicExportingMetricReader,
-)
-from opentelemetry.sdk.resources import Resource
 
 from chiron import __version__
 
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from opentelemetry.metrics import Meter
+    from opentelemetry.sdk.metrics.export import (
+        MetricExporter,
+        PeriodicExportingMetricReader,
+    )
+
 LOGGER = logging.getLogger(__name__)
 
 _METRICS_CONFIGURED = False
 
 
+@cache
 def _load_otlp_metric_exporter() -> type[MetricExporter] | None:
     """Return the OTLP metric exporter class when available."""
 
+    from opentelemetry.sdk.metrics.export import MetricExporter
+
     try:
         module = importlib.import_module(
             "opentelemetry.exporter.otlp.proto.grpc.metric_exporter"
@@ -53,6 +57,11 @@ def _create_metric_readers(
     *,
     enable_console: bool,
 ) -> list[PeriodicExportingMetricReader]:
+    from opentelemetry.sdk.metrics.export import (
+        ConsoleMetricExporter,
+        PeriodicExportingMetricReader,
+    )
+
     readers: list[PeriodicExportingMetricReader] = []
 
     if exporter_cls is not None:
@@ -75,18 +84,23 @@ def configure_metrics(
 
     global _METRICS_CONFIGURED
     if not _METRICS_CONFIGURED:
-        endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.resources import Resource
+
+        env = os.environ
+        endpoint = env.setdefault(
+            "OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"
+        )
         if endpoint.startswith("http://"):
-            os.environ.setdefault("OTEL_METRIC_EXPORT_INTERVAL", "60000")
-            os.environ.setdefault("OTEL_EXPORTER_OTLP_INSECURE", "true")
-        os.environ.setdefault("OTEL_EXPORTER_OTLP_ENDPOINT", endpoint)
+            env.setdefault("OTEL_METRIC_EXPORT_INTERVAL", "60000")
+            env.setdefault("OTEL_EXPORTER_OTLP_INSECURE", "true")
 
         attributes: dict[str, str] = {
             "service.name": service_name or namespace,
             "service.namespace": "chiron",
-            "service.instance.id": os.getenv("HOSTNAME", "local"),
-            "service.version": os.getenv("CHIRON_VERSION", __version__),
-            "deployment.environment": os.getenv("CHIRON_ENV", "development"),
+            "service.instance.id": env.get("HOSTNAME", "local"),
+            "service.version": env.get("CHIRON_VERSION", __version__),
+            "deployment.environment": env.get("CHIRON_ENV", "development"),
         }
         if resource_attributes:
             attributes.update(resource_attributes)
@@ -95,7 +109,7 @@ def configure_metrics(
         enable_console = (
             console_exporter
             if console_exporter is not None
-            else os.getenv("CHIRON_METRICS_CONSOLE", "false").lower()
+            else env.get("CHIRON_METRICS_CONSOLE", "false").lower()
             in {"1", "true", "yes"}
         )
         readers = _create_metric_readers(exporter_cls, enable_console=enable_console)
@@ -6,27 +6,39 @@ import importlib
 import logging
 import os
 from collections.abc import Mapping
+from functools import cache
+from typing import TYPE_CHECKING
 
 from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider as SdkTracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-    SimpleSpanProcessor,
-    SpanExporter,
-)
 
 from chiron import __version__
 
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+
 LOGGER = logging.getLogger(__name__)
 
 _TRACING_CONFIGURED = False
 
+# BatchSpanProcessor settings tuned for short-lived, bursty CLI processes:
+# a larger queue so bursts are not dropped, a short delay so spans are
+# exported before exit, and batches small enough to stay well under gRPC's
+# default 4 MB message limit. Each can be overridden with the standard
+# ``OTEL_BSP_*`` environment variable.
+_BSP_MAX_QUEUE_SIZE = 4096
+_BSP_SCHEDULE_DELAY_MILLIS = 1000
+_BSP_MAX_EXPORT_BATCH_SIZE = 128
+_BSP_EXPORT_TIMEOUT_MILLIS = 10000
+# Console output is for humans watching a run, so flush it sooner.
+_CONSOLE_SCHEDULE_DELAY_MILLIS = 500
+
 
+@cache
 def _load_otlp_exporter() -> type[SpanExporter] | None:
     """Return the OTLP span exporter if the optional dependency is installed."""
 
+    from opentelemetry.sdk.trace.export import SpanExporter
+
     try:
         module = importlib.import_module(
             "opentelemetry.exporter.otlp.proto.grpc.trace_exporter"
@@ -48,6 +60,57 @@ def _load_otlp_exporter() -> type[SpanExporter] | None:
     return exporter
 
 
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").lower() in {"1", "true", "yes"}
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        LOGGER.warning("Ignoring invalid %s=%r; using %d.", name, raw, default)
+        return default
+    return value
+
+
+def _batch_span_processor(
+    exporter: SpanExporter,
+    *,
+    schedule_delay_millis: int = _BSP_SCHEDULE_DELAY_MILLIS,
+) -> BatchSpanProcessor:
+    """Wrap *exporter* in a BatchSpanProcessor using Chiron's tuned settings.
+
+    *schedule_delay_millis* is the default used when ``OTEL_BSP_SCHEDULE_DELAY``
+    is unset.
+    """
+
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    max_queue_size = _env_positive_int("OTEL_BSP_MAX_QUEUE_SIZE", _BSP_MAX_QUEUE_SIZE)
+    return BatchSpanProcessor(
+        exporter,
+        max_queue_size=max_queue_size,
+        schedule_delay_millis=_env_positive_int(
+            "OTEL_BSP_SCHEDULE_DELAY", schedule_delay_millis
+        ),
+        # The SDK rejects batches larger than the queue.
+        max_export_batch_size=min(
+            max_queue_size,
+            _env_positive_int(
+                "OTEL_BSP_MAX_EXPORT_BATCH_SIZE", _BSP_MAX_EXPORT_BATCH_SIZE
+            ),
+        ),
+        export_timeout_millis=_env_positive_int(
+            "OTEL_BSP_EXPORT_TIMEOUT", _BSP_EXPORT_TIMEOUT_MILLIS
+        ),
+    )
+
+
 def configure_tracing(
     service_name: str,
     *,
@@ -63,16 +126,23 @@ def configure_tracing(
     if _TRACING_CONFIGURED:
         return trace.get_tracer_provider()
 
-    endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider as SdkTracerProvider
+    from opentelemetry.sdk.trace.export import (
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+
+    env = os.environ
+    endpoint = env.setdefault("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
     if endpoint.startswith("http://"):
-        os.environ.setdefault("OTEL_EXPORTER_OTLP_INSECURE", "true")
-    os.environ.setdefault("OTEL_EXPORTER_OTLP_ENDPOINT", endpoint)
+        env.setdefault("OTEL_EXPORTER_OTLP_INSECURE", "true")
 
     attributes: dict[str, str] = {
         "service.name": service_name,
         "service.namespace": "chiron",
-        "service.version": os.getenv("CHIRON_VERSION", __version__),
-        "deployment.environment": os.getenv("CHIRON_ENV", "development"),
+        "service.version": env.get("CHIRON_VERSION", __version__),
+        "deployment.environment": env.get("CHIRON_ENV", "development"),
     }
     if resource_attributes:
         attributes.update(resource_attributes)
@@ -85,15 +155,25 @@ def configure_tracing(
             "OTLP span exporter unavailable; enable with `pip install opentelemetry-exporter-otlp`."
         )
     else:
-        provider.add_span_processor(BatchSpanProcessor(exporter_cls()))
+        provider.add_span_processor(_batch_span_processor(exporter_cls()))
 
     enable_console = (
         console_exporter
         if console_exporter is not None
-        else os.getenv("CHIRON_TRACE_CONSOLE", "false").lower() in {"1", "true", "yes"}
+        else _env_flag("CHIRON_TRACE_CONSOLE")
     )
     if enable_console:
-        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+        # Batch console output off the traced code path; synchronous export
+        # per span stays available for debugging.
+        if _env_flag("CHIRON_TRACE_CONSOLE_SYNC"):
+            provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+        else:
+            provider.add_span_processor(
+                _batch_span_processor(
+                    ConsoleSpanExporter(),
+                    schedule_delay_millis=_CONSOLE_SCHEDULE_DELAY_MILLIS,
+                )
+            )
 
     trace.set_tracer_provider(provider)
     _TRACING_CONFIGURED = True
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 from packaging.version import InvalidVersion, Version
@@ -24,6 +25,16 @@ SEMVER_ORDER = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _parse_version(value: str) -> Version | None:
+    """Parse *value* once; guard payloads repeat the same version strings."""
+
+    try:
+        return Version(value)
+    except InvalidVersion:
+        return None
+
+
 @dataclass(slots=True)
 class AutoSyncConfig:
     """Configuration controlling automated dependency synchronization."""
@@ -93,7 +104,6 @@ class UpdateCounts:
 class UpdateAssessment:
     """Structured representation of guard findings for auto-sync decisions."""
 
-    counts: UpdateCounts
     packages_by_level: dict[str, set[str]] = field(
         default_factory=lambda: {
             SEMVER_MAJOR: set(),
@@ -103,6 +113,17 @@ class UpdateAssessment:
     )
     unclassified: set[str] = field(default_factory=set)
 
+    @property
+    def counts(self) -> UpdateCounts:
+        """Number of distinct packages at each semver level."""
+
+        by_level = self.packages_by_level
+        return UpdateCounts(
+            major=len(by_level[SEMVER_MAJOR]),
+            minor=len(by_level[SEMVER_MINOR]),
+            patch=len(by_level[SEMVER_PATCH]),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "counts": self.counts.as_dict(),
@@ -146,13 +167,14 @@ class AutoSyncOrchestrator:
         """Analyse upgrade guard output and classify candidate updates."""
 
         packages = guard.get("packages") if isinstance(guard, Mapping) else None
-        counts = UpdateCounts()
-        result = UpdateAssessment(counts=counts)
+        result = UpdateAssessment()
 
         if not isinstance(packages, Iterable):
             logger.debug("Guard payload missing package list; nothing to assess")
             return result
 
+        by_level = result.packages_by_level
+        unclassified = result.unclassified
         for entry in packages:
             if not isinstance(entry, Mapping):
                 continue
@@ -160,24 +182,17 @@ class AutoSyncOrchestrator:
             if not name:
                 continue
             level = self._classify_package(entry)
-            if level == SEMVER_MAJOR:
-                counts.major += 1
-                result.packages_by_level[SEMVER_MAJOR].add(name)
-            elif level == SEMVER_MINOR:
-                counts.minor += 1
-                result.packages_by_level[SEMVER_MINOR].add(name)
-            elif level == SEMVER_PATCH:
-                counts.patch += 1
-                result.packages_by_level[SEMVER_PATCH].add(name)
+            if level is None:
+                unclassified.add(name)
             else:
-                result.unclassified.add(name)
+                by_level[level].add(name)
 
         return result
 
     def _apply_safe_updates(self, assessment: UpdateAssessment) -> dict[str, Any]:
         """Apply safe upgrades when thresholds allow."""
 
-        allowed, exceedances = self._within_thresholds(assessment.counts)
+        allowed, exceedances = self._within_thresholds(assessment)
         packages = {
             level: sorted(names)
             for level, names in assessment.packages_by_level.items()
@@ -218,12 +233,12 @@ class AutoSyncOrchestrator:
         return outcome
 
     def _within_thresholds(
-        self, counts: UpdateCounts
+        self, assessment: UpdateAssessment
     ) -> tuple[bool, dict[str, dict[str, int | None]]]:
         exceedances: dict[str, dict[str, int | None]] = {}
         for level in (SEMVER_MAJOR, SEMVER_MINOR, SEMVER_PATCH):
             limit = self._config.get_limit(level)
-            value = getattr(counts, level)
+            value = len(assessment.packages_by_level[level])
             if limit is not None and value > limit:
                 exceedances[level] = {"count": value, "limit": limit}
         return (not exceedances, exceedances)
@@ -249,10 +264,9 @@ class AutoSyncOrchestrator:
     def _classify_by_version(current: str | None, candidate: str | None) -> str | None:
         if not current or not candidate:
             return None
-        try:
-            cur = Version(current)
-            nxt = Version(candidate)
-        except InvalidVersion:
+        cur = _parse_version(current)
+        nxt = _parse_version(candidate)
+        if cur is None or nxt is None:
             return None
 
         if nxt <= cur:
@@ -279,7 +293,9 @@ class AutoSyncOrchestrator:
     def _classify_by_reasons(reasons: Iterable[Any]) -> str | None:
         for raw in reasons:
             text = str(raw or "").lower()
-            if "upgrade" not in text and "upgrade type" not in text:
+            # "upgrade type" contains "upgrade", so one scan covers both
+            # markers; plain substring tests beat a combined regex here.
+            if "upgrade" not in text:
                 continue
             if "major" in text:
                 return SEMVER_MAJOR
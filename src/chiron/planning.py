@@ -5,8 +5,10 @@ from __future__ import annotations
 import shlex
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from rich.table import Table
+if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from rich.table import Table
 
 
 @dataclass(frozen=True, slots=True)
@@ -48,6 +50,10 @@ def render_execution_plan_table(
 ) -> Table:
     """Return a ``rich`` table representation for an execution *plan*."""
 
+    # Imported here so callers that only need plain-text plans avoid
+    # loading rich.
+    from rich.table import Table
+
     table = Table(title=title)
     table.add_column("Step", style="cyan", overflow="fold")
     table.add_column("Command", style="magenta", overflow="fold")
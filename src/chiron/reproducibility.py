@@ -6,12 +6,20 @@ by comparing checksums and metadata across different build environments.
 
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
+import os
 import zipfile
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Read size used when streaming archive members.
+_CHUNK_SIZE = 1 << 16
+# Members per worker below which comparing in a thread pool is not worth it.
+_PARALLEL_MIN_MEMBERS = 64
+
 
 @dataclass
 class WheelInfo:
@@ -72,37 +80,16 @@ class ReproducibilityChecker:
         Returns:
             WheelInfo object
         """
-        with open(wheel_path, "rb") as f:
-            content = f.read()
-            sha256 = hashlib.sha256(content).hexdigest()
-
-        size = wheel_path.stat().st_size
-
-        # Extract metadata and file list
-        metadata: dict[str, Any] = {}
-        file_list: list[str] = []
-
-        try:
-            with zipfile.ZipFile(wheel_path, "r") as zf:
-                file_list = sorted(zf.namelist())
-
-                # Try to read metadata
-                for name in zf.namelist():
-                    if name.endswith("METADATA"):
-                        with zf.open(name) as mf:
-                            metadata_text = mf.read().decode("utf-8")
-                            metadata = self._parse_metadata(metadata_text)
-                        break
-        except Exception as e:
-            metadata["error"] = str(e)
-
-        return WheelInfo(
-            name=wheel_path.name,
-            path=wheel_path,
-            sha256=sha256,
-            size=size,
-            metadata=metadata,
-            file_list=file_list,
+        stat = wheel_path.stat()
+        cached = _analyze_wheel_cached(wheel_path, stat.st_mtime_ns, stat.st_size)
+        # Hand out copies so callers cannot alter the cached analysis.
+        return replace(
+            cached,
+            metadata={
+                key: list(value) if isinstance(value, list) else value
+                for key, value in cached.metadata.items()
+            },
+            file_list=list(cached.file_list),
         )
 
     def compare_wheels(
@@ -170,10 +157,6 @@ class ReproducibilityChecker:
         Returns:
             Comparison report dictionary
         """
-        differences: list[dict[str, int | str]] = []
-        identical_files = 0
-        different_files = 0
-
         try:
             with (
                 zipfile.ZipFile(wheel1_path, "r") as zf1,
@@ -183,34 +166,31 @@ class ReproducibilityChecker:
                 files2 = set(zf2.namelist())
 
                 common_files = files1 & files2
-
-                for filename in sorted(common_files):
-                    # Skip timestamp files if configured
-                    if self.ignore_timestamps and "RECORD" in filename:
-                        continue
-
-                    with zf1.open(filename) as f1, zf2.open(filename) as f2:
-                        content1 = f1.read()
-                        content2 = f2.read()
-
-                        if content1 == content2:
-                            identical_files += 1
-                        else:
-                            different_files += 1
-                            hash1 = hashlib.sha256(content1).hexdigest()[:16]
-                            hash2 = hashlib.sha256(content2).hexdigest()[:16]
-                            differences.append(
-                                {
-                                    "file": filename,
-                                    "size1": len(content1),
-                                    "size2": len(content2),
-                                    "hash1": hash1,
-                                    "hash2": hash2,
-                                }
-                            )
+                # Skip timestamp files if configured
+                filenames = [
+                    filename
+                    for filename in sorted(common_files)
+                    if not (self.ignore_timestamps and "RECORD" in filename)
+                ]
+
+                workers = min(
+                    os.cpu_count() or 1, len(filenames) // _PARALLEL_MIN_MEMBERS
+                )
+                if workers > 1:
+                    outcomes = _compare_members_parallel(
+                        wheel1_path, wheel2_path, filenames, workers
+                    )
+                else:
+                    outcomes = [
+                        _compare_member(zf1, zf2, filename) for filename in filenames
+                    ]
         except Exception as e:
             return {"error": str(e)}
 
+        differences = [outcome for outcome in outcomes if outcome is not None]
+        different_files = len(differences)
+        identical_files = len(outcomes) - different_files
+
         return {
             "identical_files": identical_files,
             "different_files": different_files,
@@ -227,22 +207,7 @@ class ReproducibilityChecker:
         Returns:
             Parsed metadata dictionary
         """
-        metadata: dict[str, Any] = {}
-        for line in metadata_text.split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-
-                if key in metadata:
-                    # Handle multi-value fields
-                    if not isinstance(metadata[key], list):
-                        metadata[key] = [metadata[key]]
-                    metadata[key].append(value)
-                else:
-                    metadata[key] = value
-
-        return metadata
+        return _parse_metadata_text(metadata_text)
 
     def _compare_metadata(
         self, meta1: dict[str, Any], meta2: dict[str, Any]
@@ -287,6 +252,151 @@ class ReproducibilityChecker:
         return differences
 
 
+@lru_cache(maxsize=128)
+def _analyze_wheel_cached(wheel_path: Path, mtime_ns: int, size: int) -> WheelInfo:
+    """Hash and inspect a wheel once per (path, mtime, size) snapshot.
+
+    The modification time and size are part of the cache key only so that a
+    rewritten wheel is analysed afresh.
+    """
+    # Hash in chunks so large wheels are never held in memory whole.
+    with open(wheel_path, "rb") as f:
+        sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+
+    # Extract metadata and file list
+    metadata: dict[str, Any] = {}
+    file_list: list[str] = []
+
+    try:
+        with zipfile.ZipFile(wheel_path, "r") as zf:
+            file_list = sorted(zf.namelist())
+
+            # Try to read metadata
+            for name in zf.namelist():
+                if name.endswith("METADATA"):
+                    with zf.open(name) as mf:
+                        metadata_text = mf.read().decode("utf-8")
+                        metadata = _parse_metadata_text(metadata_text)
+                    break
+    except Exception as e:
+        metadata["error"] = str(e)
+
+    return WheelInfo(
+        name=wheel_path.name,
+        path=wheel_path,
+        sha256=sha256,
+        size=size,
+        metadata=metadata,
+        file_list=file_list,
+    )
+
+
+def _parse_metadata_text(metadata_text: str) -> dict[str, Any]:
+    """Parse the text of a wheel METADATA file into a dictionary."""
+    metadata: dict[str, Any] = {}
+    for line in metadata_text.split("\n"):
+        if ":" in line:
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+
+            if key in metadata:
+                # Handle multi-value fields
+                if not isinstance(metadata[key], list):
+                    metadata[key] = [metadata[key]]
+                metadata[key].append(value)
+            else:
+                metadata[key] = value
+
+    return metadata
+
+
+def _compare_member(
+    zf1: zipfile.ZipFile, zf2: zipfile.ZipFile, filename: str
+) -> dict[str, int | str] | None:
+    """Compare one member of two archives.
+
+    Returns:
+        None when the member is identical, otherwise a difference record
+    """
+    info1 = zf1.getinfo(filename)
+    info2 = zf2.getinfo(filename)
+    if _members_equal(zf1, zf2, info1, info2):
+        return None
+    return {
+        "file": filename,
+        "size1": info1.file_size,
+        "size2": info2.file_size,
+        "hash1": _member_sha256(zf1, info1)[:16],
+        "hash2": _member_sha256(zf2, info2)[:16],
+    }
+
+
+def _compare_member_batch(
+    wheel1_path: Path, wheel2_path: Path, filenames: list[str]
+) -> list[dict[str, int | str] | None]:
+    """Compare a run of members using archive handles private to this call."""
+    with (
+        zipfile.ZipFile(wheel1_path, "r") as zf1,
+        zipfile.ZipFile(wheel2_path, "r") as zf2,
+    ):
+        return [_compare_member(zf1, zf2, filename) for filename in filenames]
+
+
+def _compare_members_parallel(
+    wheel1_path: Path, wheel2_path: Path, filenames: list[str], workers: int
+) -> list[dict[str, int | str] | None]:
+    """Compare members across threads, returning outcomes in input order.
+
+    Decompression and hashing release the GIL, so each worker takes a
+    contiguous slice of members and opens its own archive handles;
+    ``ZipFile`` objects are not shared between threads.
+    """
+    size = -(-len(filenames) // workers)
+    batches = [filenames[i : i + size] for i in range(0, len(filenames), size)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            _compare_member_batch,
+            [wheel1_path] * len(batches),
+            [wheel2_path] * len(batches),
+            batches,
+        )
+        return [outcome for batch in results for outcome in batch]
+
+
+def _members_equal(
+    zf1: zipfile.ZipFile,
+    zf2: zipfile.ZipFile,
+    info1: zipfile.ZipInfo,
+    info2: zipfile.ZipInfo,
+) -> bool:
+    """Return True when two archive members hold identical bytes.
+
+    Differing sizes or CRCs settle the question without decompressing;
+    otherwise both members are streamed in chunks and compared until the
+    first mismatch.
+    """
+    if info1.file_size != info2.file_size or info1.CRC != info2.CRC:
+        return False
+
+    with zf1.open(info1) as f1, zf2.open(info2) as f2:
+        while True:
+            chunk1 = f1.read(_CHUNK_SIZE)
+            if chunk1 != f2.read(_CHUNK_SIZE):
+                return False
+            if not chunk1:
+                return True
+
+
+def _member_sha256(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> str:
+    """Return the SHA256 hex digest of an archive member, read in chunks."""
+    digest = hashlib.sha256()
+    with zf.open(info) as member:
+        while chunk := member.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def check_reproducibility(wheel1: Path, wheel2: Path) -> ReproducibilityReport:
     """Check if two wheels are reproducible.
 
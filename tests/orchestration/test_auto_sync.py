@@ -139,3 +139,39 @@ def test_execute_applies_safe_updates_when_within_threshold() -> None:
         }
     ]
     assert result["auto_apply"]["plan"] == {"success": True}
+
+
+def test_assessment_counts_follow_distinct_packages() -> None:
+    guard = {
+        "packages": [
+            {"name": "pkg-minor", "current": "1.0.0", "candidate": "1.1.0"},
+            {"name": "pkg-minor", "current": "1.0.0", "candidate": "1.1.0"},
+            {"name": "pkg-patch", "current": "1.0.0", "candidate": "1.0.1"},
+        ]
+    }
+    orchestrator = AutoSyncOrchestrator(
+        cast(Any, FakeCoordinator(guard)),
+        AutoSyncConfig(max_minor_updates=1, max_patch_updates=1),
+    )
+
+    assessment = orchestrator._assess_updates(guard)
+    outcome = orchestrator._apply_safe_updates(assessment)
+
+    assert assessment.to_dict()["counts"] == {"major": 0, "minor": 1, "patch": 1}
+    assert outcome["allowed"] is True
+
+
+def test_classify_by_reasons_prefers_highest_level_in_upgrade_reasons() -> None:
+    classify = AutoSyncOrchestrator._classify_by_reasons
+
+    assert classify(["major version bump"]) is None
+    assert classify([None, "Upgrade type: PATCH"]) == "patch"
+    assert classify(["minor or major upgrade"]) == "major"
+
+
+def test_classify_by_version_handles_invalid_versions() -> None:
+    classify = AutoSyncOrchestrator._classify_by_version
+
+    assert classify("1.0.0", "not-a-version") is None
+    assert classify("1.0.0", "1.0.0.post1") == "patch"
+    assert classify("1.0", "1.1") == "minor"
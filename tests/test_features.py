@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import chiron.features as features
 
 
@@ -37,3 +39,80 @@ def test_feature_flag_env_fallback(monkeypatch):
     monkeypatch.setattr(
         features, "OPENFEATURE_AVAILABLE", original_available, raising=False
     )
+
+
+def test_provider_evaluations_are_memoized(monkeypatch):
+    """Provider lookups should be cached per instance until cleared."""
+    calls: list[str] = []
+
+    class _Client:
+        def get_boolean_value(self, flag_key, default, context):
+            calls.append(flag_key)
+            return True
+
+    class _Api:
+        @staticmethod
+        def get_client():
+            return _Client()
+
+    monkeypatch.setattr(features, "OPENFEATURE_AVAILABLE", True, raising=False)
+    monkeypatch.setattr(features, "api", _Api, raising=False)
+    flags = features.FeatureFlags.__new__(features.FeatureFlags)
+    flags._initialized = True
+    flags._bool_cache = {}
+    flags._string_cache = {}
+
+    assert flags.is_enabled("enable_mcp_agent") is True
+    assert flags.is_enabled("enable_mcp_agent") is True
+    assert calls == ["enable_mcp_agent"]
+
+    flags.clear_cache()
+    assert flags.is_enabled("enable_mcp_agent") is True
+    assert calls == ["enable_mcp_agent", "enable_mcp_agent"]
+
+
+def test_default_flags_are_built_on_first_access(monkeypatch):
+    """`DEFAULT_FLAGS` should be constructed lazily and then reused."""
+    monkeypatch.setattr(features, "OPENFEATURE_AVAILABLE", False, raising=False)
+    assert features.FeatureFlags.DEFAULT_FLAGS == {}
+
+    class _Flag:
+        def __init__(self, default_variant, variants):
+            self.default_variant = default_variant
+
+    monkeypatch.setattr(features, "OPENFEATURE_AVAILABLE", True, raising=False)
+    monkeypatch.setattr(features, "InMemoryFlag", _Flag, raising=False)
+    monkeypatch.setattr(features.FeatureFlags, "_DEFAULT_FLAGS_CACHE", None)
+
+    defaults = features.FeatureFlags.DEFAULT_FLAGS
+    assert defaults["enable_mcp_agent"].default_variant == "off"
+    assert features.FeatureFlags.DEFAULT_FLAGS is defaults
+
+
+def test_get_feature_flags_constructs_once_under_contention(monkeypatch):
+    """Concurrent first calls should share a single FeatureFlags instance."""
+    _reset_feature_singleton()
+    created: list[object] = []
+    barrier = threading.Barrier(8)
+
+    class _CountingFlags(features.FeatureFlags):
+        def __init__(self) -> None:
+            created.append(self)
+            super().__init__()
+
+    monkeypatch.setattr(features, "FeatureFlags", _CountingFlags)
+    results: list[object] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(features.get_feature_flags())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+    _reset_feature_singleton()
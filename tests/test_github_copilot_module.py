@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -10,6 +12,12 @@ import pytest
 from chiron.github import copilot
 
 
+@pytest.fixture(autouse=True)
+def _reset_copilot_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(copilot, "_UV_PATH_CACHE", None)
+    monkeypatch.setattr(copilot, "_WORKFLOW_EXISTS_CACHE", {})
+
+
 def test_detect_agent_environment_when_indicator_present() -> None:
     is_agent, indicators = copilot.detect_agent_environment(
         {"GITHUB_COPILOT_AGENT_ID": "abc123"}
@@ -123,3 +131,172 @@ def test_collect_status_reports_overrides(
     assert status.workflow_present is False
     assert status.uv_available is True
     assert status.indicator_keys == ()
+
+
+def test_detect_agent_environment_ignores_empty_indicators() -> None:
+    env = {"COPILOT_AGENT_ID": "", "GITHUB_COPILOT_RUN_ID": "7", "GITHUB_ACTIONS": ""}
+
+    is_agent, indicators = copilot.detect_agent_environment(env)
+
+    assert is_agent is True
+    assert indicators == ("GITHUB_COPILOT_RUN_ID",)
+
+
+def test_cached_which_uv_refreshes_when_path_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    uv = tmp_path / "uv"
+    uv.write_text("", encoding="utf-8")
+    monkeypatch.setenv("PATH", "/opt/one")
+    with patch(
+        "chiron.github.copilot.shutil.which", return_value=str(uv)
+    ) as mock_which:
+        assert copilot._cached_which_uv() == str(uv)
+        assert copilot._cached_which_uv() == str(uv)
+        assert mock_which.call_count == 1
+
+        monkeypatch.setenv("PATH", "/opt/two")
+        mock_which.return_value = None
+        assert copilot._cached_which_uv() is None
+        assert mock_which.call_count == 2
+
+
+def test_cached_which_uv_rechecks_misses_and_removed_executables(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    uv = tmp_path / "uv"
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with patch("chiron.github.copilot.shutil.which", return_value=None) as mock_which:
+        assert copilot._cached_which_uv() is None
+
+        uv.write_text("", encoding="utf-8")
+        mock_which.return_value = str(uv)
+        assert copilot._cached_which_uv() == str(uv)
+        assert mock_which.call_count == 2
+
+        uv.unlink()
+        mock_which.return_value = None
+        assert copilot._cached_which_uv() is None
+        assert mock_which.call_count == 3
+
+
+def test_format_status_json_is_sorted_and_indented(tmp_path: Path) -> None:
+    status = copilot.CopilotStatus(
+        workspace_root=tmp_path,
+        is_agent_environment=True,
+        indicator_keys=("COPILOT_AGENT_ID",),
+        wheelhouse_disabled=True,
+        workflow_present=False,
+        uv_available=True,
+        pip_overrides_active=False,
+    )
+
+    rendered = copilot.format_status_json(status)
+
+    assert rendered == json.dumps(status.as_dict(), indent=2, sort_keys=True)
+
+
+def test_build_uv_command_default_and_custom_forms() -> None:
+    default = copilot._build_uv_command(
+        "uv", all_extras=True, extras=None, include_dev=True, additional_args=None
+    )
+    custom = copilot._build_uv_command(
+        "uv",
+        all_extras=True,
+        extras=None,
+        include_dev=True,
+        additional_args=["--frozen"],
+    )
+
+    assert default == ["uv", "sync", "--all-extras", "--dev"]
+    assert custom == ["uv", "sync", "--all-extras", "--dev", "--frozen"]
+
+
+def test_status_serialisation_tracks_current_fields(tmp_path: Path) -> None:
+    status = copilot.CopilotStatus(
+        workspace_root=tmp_path,
+        is_agent_environment=False,
+        indicator_keys=("COPILOT_AGENT_ID",),
+        wheelhouse_disabled=False,
+        workflow_present=True,
+        uv_available=False,
+        pip_overrides_active=False,
+    )
+
+    first = status.as_dict()
+    first["indicator_keys"].append("MUTATED")
+    first["uv_available"] = True
+
+    assert status.as_dict()["indicator_keys"] == ["COPILOT_AGENT_ID"]
+    assert status.as_dict()["uv_available"] is False
+    assert '"MUTATED"' not in copilot.format_status_json(status)
+
+    status.uv_available = True
+    assert json.loads(copilot.format_status_json(status))["uv_available"] is True
+
+
+@pytest.mark.parametrize(
+    ("shell", "first_line"),
+    [
+        ("bash", f"export {copilot.COPILOT_DISABLE_ENV_VAR}=1"),
+        ("Fish", f"set -gx {copilot.COPILOT_DISABLE_ENV_VAR} 1"),
+        ("pwsh", f'$Env:{copilot.COPILOT_DISABLE_ENV_VAR} = "1"'),
+        ("cmd", f"set {copilot.COPILOT_DISABLE_ENV_VAR}=1"),
+    ],
+)
+def test_generate_env_exports_per_shell(shell: str, first_line: str) -> None:
+    assert copilot.generate_env_exports(shell).splitlines()[0] == first_line
+
+
+def test_generate_env_exports_rejects_unknown_shell() -> None:
+    with pytest.raises(copilot.CopilotProvisioningError, match="tcsh"):
+        copilot.generate_env_exports("tcsh")
+
+
+def test_env_helpers_coerce_only_when_needed() -> None:
+    plain = {"PIP_NO_INDEX": "1"}
+    mixed = {"PIP_NO_INDEX": 1}
+
+    assert copilot._read_env(plain) is plain
+    assert copilot._mutable_env(plain) == plain
+    assert copilot._mutable_env(plain) is not plain
+    assert copilot._read_env(mixed) == {"PIP_NO_INDEX": "1"}  # type: ignore[arg-type]
+
+
+def test_workflow_presence_is_cached_briefly(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workflow = tmp_path / "copilot-setup-steps.yml"
+    clock = iter([100.0, 101.0, 106.0])
+    monkeypatch.setattr(copilot, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+
+    assert copilot._workflow_exists(workflow) is False
+    workflow.write_text("name: setup\n")
+    assert copilot._workflow_exists(workflow) is False
+    assert copilot._workflow_exists(workflow) is True
+
+
+def test_prepare_environment_inherits_env_when_overrides_present(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv(copilot.COPILOT_DISABLE_ENV_VAR, "1")
+    monkeypatch.delenv("PIP_NO_INDEX", raising=False)
+    monkeypatch.delenv("PIP_FIND_LINKS", raising=False)
+
+    with patch("chiron.github.copilot.subprocess.run") as mock_run:
+        mock_run.return_value = SimpleNamespace(returncode=0)
+        result = copilot.prepare_environment(
+            workspace_root=tmp_path, uv_path="/usr/bin/uv"
+        )
+
+    assert mock_run.call_args.kwargs["env"] is None
+    assert result.env_overrides == {copilot.COPILOT_DISABLE_ENV_VAR: "1"}
+
+    monkeypatch.setenv("PIP_NO_INDEX", "1")
+    with patch("chiron.github.copilot.subprocess.run") as mock_run:
+        mock_run.return_value = SimpleNamespace(returncode=0)
+        copilot.prepare_environment(workspace_root=tmp_path, uv_path="/usr/bin/uv")
+
+    child_env = mock_run.call_args.kwargs["env"]
+    assert child_env is not None
+    assert "PIP_NO_INDEX" not in child_env
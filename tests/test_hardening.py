@@ -87,6 +87,28 @@ class TestInstallThincSeedGuard:
 
         assert hardening.install_thinc_seed_guard() is False
 
+    def test_skips_import_hook_when_thinc_missing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sys.modules.pop("chiron.hardening", None)
+        import chiron.hardening as hardening
+
+        original_import_module = importlib.import_module
+
+        def missing_thinc(name: str, package: str | None = None):
+            if name == "thinc.util":
+                raise ModuleNotFoundError("No module named 'thinc'", name="thinc")
+            return original_import_module(name, package)
+
+        monkeypatch.setattr(importlib, "import_module", missing_thinc)
+
+        assert hardening.install_thinc_seed_guard() is False
+        assert hardening._FINDER is None
+        assert not any(
+            isinstance(finder, hardening._ThincSeedGuardFinder)
+            for finder in sys.meta_path
+        )
+
     def test_import_hook_cleans_up_after_lazy_import(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -94,6 +116,7 @@ class TestInstallThincSeedGuard:
             sys.modules.pop(key, None)
 
         import chiron.hardening as hardening
+
         importlib.reload(hardening)
 
         thinc_pkg = types.ModuleType("thinc")
@@ -154,6 +177,7 @@ class TestInstallThincSeedGuard:
             sys.modules.pop(key, None)
 
         import chiron.hardening as hardening
+
         importlib.reload(hardening)
 
         thinc_pkg = types.ModuleType("thinc")
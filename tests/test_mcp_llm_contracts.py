@@ -11,7 +11,9 @@ from chiron.mcp.llm_contracts import (
     LLMContractRunner,
     default_llm_client,
     default_scenarios,
+    run_default_contracts,
 )
+from chiron.mcp.server import MCPServer
 
 
 class StubClient:
@@ -57,3 +59,113 @@ def test_deterministic_client_requires_configured_prompt():
     client = DeterministicLLMClient({"known": "{}"})
     with pytest.raises(KeyError):
         client.generate("unknown")
+
+
+def test_run_all_batches_scenarios_sharing_a_tool():
+    class RecordingServer(MCPServer):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[tuple[str, int]] = []
+
+        def execute_batch(self, tool_name, arguments_list):
+            arguments_list = list(arguments_list)
+            self.batches.append((tool_name, len(arguments_list)))
+            return super().execute_batch(tool_name, arguments_list)
+
+    health = json.dumps({"tool": "chiron_health_check", "arguments": {}})
+    wheelhouse = json.dumps(
+        {"tool": "chiron_build_wheelhouse", "arguments": {"dry_run": True}}
+    )
+    client = DeterministicLLMClient(
+        {"a": health, "b": health, "c": wheelhouse, "d": health}
+    )
+    scenarios = [
+        ContractScenario(prompt=prompt, expected_keys={"status"})
+        for prompt in ("a", "b", "c", "d")
+    ]
+    server = RecordingServer()
+
+    results = LLMContractRunner(client, server).run_all(scenarios)
+
+    assert [result.scenario.prompt for result in results] == ["a", "b", "c", "d"]
+    assert server.batches == [
+        ("chiron_health_check", 2),
+        ("chiron_build_wheelhouse", 1),
+        ("chiron_health_check", 1),
+    ]
+
+
+def test_run_all_stops_after_a_failed_contract():
+    class RecordingServer:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def execute_tool(self, tool_name, arguments):
+            self.calls.append(tool_name)
+            return {"status": "ok"}
+
+    health = json.dumps({"tool": "chiron_health_check", "arguments": {}})
+    wheelhouse = json.dumps(
+        {"tool": "chiron_build_wheelhouse", "arguments": {"dry_run": True}}
+    )
+    client = DeterministicLLMClient({"a": health, "b": health, "c": wheelhouse})
+    scenarios = [
+        ContractScenario(prompt="a", expected_keys={"status", "version"}),
+        ContractScenario(prompt="b", expected_keys={"status"}),
+        ContractScenario(prompt="c", expected_keys={"status"}),
+    ]
+    server = RecordingServer()
+
+    with pytest.raises(ContractAssertionError):
+        LLMContractRunner(client, server).run_all(scenarios)  # type: ignore[arg-type]
+
+    assert server.calls == ["chiron_health_check"]
+
+
+def test_deterministic_client_parses_responses_once(monkeypatch):
+    payload = json.dumps({"tool": "chiron_health_check", "arguments": {}})
+    client = DeterministicLLMClient({"health": payload, "broken": "not json"})
+
+    def fail_loads(*_args, **_kwargs):
+        raise AssertionError("responses should already be decoded")
+
+    monkeypatch.setattr("chiron.mcp.llm_contracts.json.loads", fail_loads)
+    assert client.generate_parsed("health") == {
+        "tool": "chiron_health_check",
+        "arguments": {},
+    }
+    monkeypatch.undo()
+
+    scenario = ContractScenario(prompt="broken", expected_keys=set())
+    with pytest.raises(ContractAssertionError, match="not json"):
+        LLMContractRunner(client).run(scenario)
+
+
+def test_executions_do_not_share_the_clients_decoded_arguments():
+    payload = json.dumps(
+        {"tool": "chiron_build_wheelhouse", "arguments": {"dry_run": True}}
+    )
+    client = DeterministicLLMClient({"build": payload})
+    scenario = ContractScenario(prompt="build", expected_keys={"status"})
+
+    execution = LLMContractRunner(client).run(scenario)
+    execution.arguments["dry_run"] = False
+
+    assert client.generate_parsed("build")["arguments"] == {"dry_run": True}
+
+
+def test_default_scenarios_are_independent_copies():
+    scenarios = default_scenarios()
+    scenarios[1].expected_keys.add("not-returned")
+    scenarios[0].prompt = "changed"
+    scenarios.clear()
+
+    assert len(default_scenarios()) == 2
+    executions = run_default_contracts()
+    assert [execution.tool for execution in executions] == [
+        "chiron_health_check",
+        "chiron_build_wheelhouse",
+    ]
+
+    executions[0].scenario.expected_keys.add("not-returned")
+    assert len(run_default_contracts()) == 2
@@ -5,7 +5,12 @@ import sys
 import types
 from unittest.mock import Mock, patch
 
-from chiron.mcp.server import MCPServer, create_mcp_server_config
+from chiron.mcp.server import (
+    MCPServer,
+    create_mcp_server_config,
+    create_mcp_server_config_json,
+    invalidate_feature_flag_snapshot,
+)
 
 
 class TestMCPServer:
@@ -203,6 +208,69 @@ class TestMCPServer:
             assert "flags" in result
             assert isinstance(result["flags"], dict)
 
+    def test_execute_tool_get_feature_flags_is_memoized(self):
+        """Test that flag evaluations are reused until invalidated."""
+        server = MCPServer()
+        mock_feature_manager = Mock()
+        mock_feature_manager.is_enabled = Mock(return_value=False)
+        mock_feature_manager.uses_environment_fallback = False
+
+        with patch(
+            "chiron.mcp.server._get_feature_flags_resolver",
+            return_value=mock_feature_manager,
+        ):
+            first = server.execute_tool("chiron_get_feature_flags", {})
+            first["flags"]["enable_mcp_agent"] = True
+            second = server.execute_tool("chiron_get_feature_flags", {})
+            calls = mock_feature_manager.is_enabled.call_count
+
+            invalidate_feature_flag_snapshot()
+            server.execute_tool("chiron_get_feature_flags", {})
+
+        assert second["flags"]["enable_mcp_agent"] is False
+        assert calls == len(second["flags"])
+        assert mock_feature_manager.is_enabled.call_count == 2 * calls
+
+    def test_execute_tool_get_feature_flags_reads_env_fallback_live(self, monkeypatch):
+        """Test that environment-backed flags are never served from the memo."""
+        from chiron.features import FeatureFlags
+
+        monkeypatch.setattr("chiron.features.OPENFEATURE_AVAILABLE", False)
+        flags = FeatureFlags()
+        server = MCPServer()
+
+        with patch("chiron.mcp.server._get_feature_flags_resolver", return_value=flags):
+            monkeypatch.setenv("CHIRON_FEATURE_ENABLE_MCP_AGENT", "true")
+            first = server.execute_tool("chiron_get_feature_flags", {})
+            monkeypatch.setenv("CHIRON_FEATURE_ENABLE_MCP_AGENT", "false")
+            second = server.execute_tool("chiron_get_feature_flags", {})
+
+        assert first["flags"]["enable_mcp_agent"] is True
+        assert second["flags"]["enable_mcp_agent"] is False
+
+    def test_execute_tool_get_feature_flags_reports_each_flag(self):
+        """Test that precomputed flag reports match the individual flags."""
+        server = MCPServer()
+        enabled = {"require_slsa_provenance", "dry_run_by_default"}
+        mock_feature_manager = Mock()
+        mock_feature_manager.is_enabled = Mock(side_effect=enabled.__contains__)
+
+        invalidate_feature_flag_snapshot()
+        with patch(
+            "chiron.mcp.server._get_feature_flags_resolver",
+            return_value=mock_feature_manager,
+        ):
+            result = server.execute_tool("chiron_get_feature_flags", {})
+
+        assert {key for key, value in result["flags"].items() if value} == enabled
+        assert set(result["flags"]) == {
+            "allow_public_publish",
+            "require_slsa_provenance",
+            "enable_oci_distribution",
+            "enable_mcp_agent",
+            "dry_run_by_default",
+        }
+
     def test_execute_tool_get_feature_flags_without_module(self):
         """Test executing get_feature_flags tool without features module."""
         server = MCPServer()
@@ -222,6 +290,56 @@ class TestMCPServer:
         assert "available_tools" in result
         assert isinstance(result["available_tools"], list)
 
+    def test_execute_tool_rejects_arguments_violating_schema(self):
+        """Test that arguments are validated against the tool's input schema."""
+        server = MCPServer()
+        result = server.execute_tool("chiron_build_wheelhouse", {"dry_run": "yes"})
+
+        assert result["status"] == "error"
+        assert result["message"].startswith(
+            "Invalid arguments for chiron_build_wheelhouse:"
+        )
+        assert MCPServer._VALIDATORS["chiron_build_wheelhouse"] is (
+            MCPServer._argument_validator("chiron_build_wheelhouse")
+        )
+
+    def test_dry_run_responses_are_independent(self):
+        """Test that dry-run responses built from templates are fresh dicts."""
+        server = MCPServer()
+        first = server.execute_tool("chiron_create_airgap_bundle", {})
+        first["status"] = "mutated"
+
+        second = server.execute_tool("chiron_create_airgap_bundle", {"output": "x"})
+
+        assert second["status"] == "dry_run"
+        assert list(second)[:3] == ["status", "message", "version"]
+        assert second["output"] == "x"
+
+    def test_execute_tool_resolves_route_once(self):
+        """Test that handler and validator are resolved once per tool."""
+        server = MCPServer()
+        server.execute_tool("chiron_health_check", {})
+        route = server._routes["chiron_health_check"]
+
+        server.execute_tool("chiron_health_check", {})
+
+        assert server._routes["chiron_health_check"] is route
+        assert route[1] is MCPServer._argument_validator("chiron_health_check")
+        assert "unknown_tool" not in server._routes
+
+    def test_execute_batch_preserves_argument_order(self):
+        """Test executing one tool for several argument sets."""
+        server = MCPServer()
+        results = server.execute_batch(
+            "chiron_build_wheelhouse",
+            [{"output_dir": "first"}, {"output_dir": "second"}],
+        )
+
+        assert [result["output_dir"] for result in results] == ["first", "second"]
+        assert server.execute_batch("unknown_tool", [{}])[0]["error"] == (
+            "Unknown tool: unknown_tool"
+        )
+
     def test_build_wheelhouse_defaults(self):
         """Test _build_wheelhouse with default arguments."""
         server = MCPServer()
@@ -267,7 +385,9 @@ class TestMCPServer:
     def test_build_wheelhouse_import_error(self, tmp_path, monkeypatch):
         """Missing bundler should return error state."""
         server = MCPServer()
-        monkeypatch.setitem(sys.modules, "chiron.deps.bundler", types.ModuleType("empty"))
+        monkeypatch.setitem(
+            sys.modules, "chiron.deps.bundler", types.ModuleType("empty")
+        )
 
         result = server._build_wheelhouse(
             {"dry_run": False, "output_dir": str(tmp_path)}
@@ -275,6 +395,28 @@ class TestMCPServer:
 
         assert result["status"] == "error"
 
+    def test_missing_optional_module_is_not_reimported(self, monkeypatch):
+        """A module that failed to import should not be searched for again."""
+        import chiron.mcp.server as server_module
+
+        attempts: list[str] = []
+
+        def failing_import(name: str, package: str | None = None):
+            attempts.append(name)
+            raise ModuleNotFoundError(name)
+
+        monkeypatch.setattr(server_module, "_UNAVAILABLE_MODULES", set())
+        monkeypatch.setattr(server_module.importlib, "import_module", failing_import)
+        monkeypatch.delitem(sys.modules, "chiron.deps.policy", raising=False)
+        server = MCPServer()
+
+        first = server._check_policy({})
+        second = server._check_policy({})
+
+        assert first["status"] == second["status"] == "error"
+        assert "not available" in second["message"]
+        assert attempts == ["chiron.deps.policy"]
+
     def test_verify_artifacts_skeleton(self):
         """Test _verify_artifacts with real implementation."""
         server = MCPServer()
@@ -419,6 +561,13 @@ class TestCreateMCPServerConfig:
         parsed = json.loads(json_str)
         assert parsed == config
 
+    def test_config_json_cached(self):
+        """Test that the serialised config is built once and stays valid."""
+        first = create_mcp_server_config_json()
+
+        assert create_mcp_server_config_json() is first
+        assert json.loads(first) == create_mcp_server_config()
+
 
 class TestMCPServerTools:
     """Test cases for individual MCP tools."""
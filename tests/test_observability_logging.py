@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
@@ -9,6 +10,7 @@ from unittest.mock import patch
 
 from chiron.observability.logging import (
     DEFAULT_LOG_LEVEL,
+    _JsonBytesHandler,
     _JsonFormatter,
     configure_logging,
 )
@@ -170,6 +172,146 @@ class TestJsonFormatter:
 
             assert parsed["run_mode"] == "production"
 
+    def test_format_resolves_hostname_once(self) -> None:
+        """Test that the hostname is looked up at construction, not per record."""
+        with patch(
+            "chiron.observability.logging.socket.gethostname", return_value="node-1"
+        ) as gethostname:
+            formatter = _JsonFormatter()
+            record = logging.LogRecord(
+                name="test.logger",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=10,
+                msg="Test",
+                args=(),
+                exc_info=None,
+            )
+
+            first = json.loads(formatter.format(record))
+            formatter.format(record)
+
+        assert first["hostname"] == "node-1"
+        assert gethostname.call_count == 1
+
+    def test_timestamp_matches_datetime_isoformat(self) -> None:
+        """Test that the fast timestamp path renders like datetime.isoformat."""
+        from datetime import UTC, datetime
+
+        formatter = _JsonFormatter()
+        for created in (1700000000.0, 1700000000.25, 1700000000.9999996, 0.5):
+            expected = datetime.fromtimestamp(created, tz=UTC).isoformat()
+            assert formatter._timestamp(created) == expected
+
+    def test_format_falls_back_to_stdlib_json(self) -> None:
+        """Test that values orjson cannot encode still serialise."""
+        formatter = _JsonFormatter()
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Big numbers",
+            args=(),
+            exc_info=None,
+        )
+        record.counts = {1: 2**70}
+
+        rendered = formatter.format(record)
+
+        assert json.loads(rendered)["counts"] == {"1": 2**70}
+        assert '"counts": {"1": ' in rendered
+
+    def test_format_tracks_extras_per_record_layout(self) -> None:
+        """Test that cached attribute layouts still pick up new extras."""
+        formatter = _JsonFormatter()
+
+        def make_record() -> logging.LogRecord:
+            return logging.LogRecord(
+                name="test.logger",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=10,
+                msg="Layout",
+                args=(),
+                exc_info=None,
+            )
+
+        plain = json.loads(formatter.format(make_record()))
+        enriched_record = make_record()
+        enriched_record.tenant = "acme"
+        enriched_record._private = "hidden"
+        enriched = json.loads(formatter.format(enriched_record))
+
+        assert "tenant" not in plain
+        assert enriched["tenant"] == "acme"
+        assert "_private" not in enriched
+        assert list(enriched)[-1] == "tenant"
+
+    def test_format_message_with_args_and_non_string_msg(self) -> None:
+        """Test that interpolation and non-string messages still render."""
+        formatter = _JsonFormatter()
+
+        def render(msg: object, args: tuple[object, ...]) -> str:
+            record = logging.LogRecord(
+                name="test.logger",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=10,
+                msg=msg,
+                args=args,
+                exc_info=None,
+            )
+            return json.loads(formatter.format(record))["message"]
+
+        assert render("plain %s", ()) == "plain %s"
+        assert render("hello %s", ("world",)) == "hello world"
+        assert render(ValueError("boom"), ()) == "boom"
+
+
+class TestJsonBytesHandler:
+    """Tests for _JsonBytesHandler."""
+
+    @staticmethod
+    def _emit(encoding: str) -> io.BytesIO:
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding=encoding, write_through=True)
+        handler = _JsonBytesHandler(stream)
+        handler.setFormatter(_JsonFormatter(service_name="bytes"))
+        stream.write("before\n")
+        handler.emit(
+            logging.LogRecord(
+                name="test.logger",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=10,
+                msg="caf\u00e9",
+                args=(),
+                exc_info=None,
+            )
+        )
+        stream.detach()
+        return raw
+
+    def test_writes_utf8_bytes_in_order(self) -> None:
+        """Test that records bypass the text layer without reordering."""
+        raw = self._emit("utf-8")
+
+        before, line, trailer = raw.getvalue().split(b"\n")
+
+        assert before == b"before"
+        assert json.loads(line)["message"] == "caf\u00e9"
+        assert trailer == b""
+
+    def test_falls_back_to_text_path_for_other_encodings(self) -> None:
+        """Test that non-UTF-8 streams still receive correctly encoded text."""
+        raw = self._emit("utf-16")
+
+        lines = raw.getvalue().decode("utf-16").splitlines()
+
+        assert lines[0] == "before"
+        assert json.loads(lines[1])["message"] == "caf\u00e9"
+
 
 class TestConfigureLogging:
     """Tests for configure_logging function."""
@@ -252,6 +394,19 @@ class TestConfigureLogging:
 
         assert logger is root_logger
 
+    def test_configure_logging_reuses_formatter_and_handler(self) -> None:
+        """Test that repeated identical configuration keeps the same handler."""
+        first = configure_logging(service_name="reuse-service").handlers[0]
+        second = configure_logging(service_name="reuse-service").handlers[0]
+
+        assert second is first
+
+        third = configure_logging(level="DEBUG", service_name="reuse-service")
+
+        assert third.handlers[0] is not first
+        assert third.handlers[0].formatter is first.formatter
+        assert third.level == logging.DEBUG
+
     def test_default_log_level_constant(self) -> None:
         """Test that DEFAULT_LOG_LEVEL is set correctly."""
         assert DEFAULT_LOG_LEVEL == "INFO"
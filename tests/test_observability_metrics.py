@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 from opentelemetry.metrics import Meter
 from opentelemetry.sdk.metrics.export import (
     ConsoleMetricExporter,
     PeriodicExportingMetricReader,
 )
 
+from chiron.observability import metrics as metrics_module
 from chiron.observability.metrics import (
     _create_metric_readers,
     _load_otlp_metric_exporter,
@@ -18,6 +21,19 @@ from chiron.observability.metrics import (
 )
 
 
+def test_sdk_not_bound_at_import() -> None:
+    """Test that SDK classes are only imported when metrics are configured."""
+    assert not hasattr(metrics_module, "MeterProvider")
+    assert not hasattr(metrics_module, "PeriodicExportingMetricReader")
+
+
+@pytest.fixture(autouse=True)
+def _clear_exporter_cache() -> Iterator[None]:
+    _load_otlp_metric_exporter.cache_clear()
+    yield
+    _load_otlp_metric_exporter.cache_clear()
+
+
 class TestLoadOTLPMetricExporter:
     """Tests for _load_otlp_metric_exporter."""
 
@@ -30,6 +46,15 @@ class TestLoadOTLPMetricExporter:
         if exporter_cls is not None:
             assert isinstance(exporter_cls, type)
 
+    @patch("chiron.observability.metrics.importlib.import_module")
+    def test_load_otlp_metric_exporter_is_cached(self, mock_import: Mock) -> None:
+        """Test that the exporter lookup runs once per process."""
+        mock_import.side_effect = ModuleNotFoundError("Module not found")
+
+        assert _load_otlp_metric_exporter() is None
+        assert _load_otlp_metric_exporter() is None
+        mock_import.assert_called_once()
+
     @patch("chiron.observability.metrics.importlib.import_module")
     def test_load_otlp_metric_exporter_not_available(self, mock_import: Mock) -> None:
         """Test when OTLP metric exporter module is not available."""
@@ -3,11 +3,32 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
 
-from chiron.observability.tracing import _load_otlp_exporter, configure_tracing
+from chiron.observability import tracing
+from chiron.observability.tracing import (
+    _batch_span_processor,
+    _load_otlp_exporter,
+    configure_tracing,
+)
+
+
+def test_sdk_not_bound_at_import() -> None:
+    """Test that SDK classes are only imported when tracing is configured."""
+    assert not hasattr(tracing, "SdkTracerProvider")
+    assert not hasattr(tracing, "BatchSpanProcessor")
+
+
+@pytest.fixture(autouse=True)
+def _clear_exporter_cache() -> Iterator[None]:
+    _load_otlp_exporter.cache_clear()
+    yield
+    _load_otlp_exporter.cache_clear()
 
 
 class TestLoadOTLPExporter:
@@ -54,6 +75,45 @@ class TestLoadOTLPExporter:
         assert result is None
 
 
+class TestBatchSpanProcessor:
+    """Tests for _batch_span_processor."""
+
+    @patch("opentelemetry.sdk.trace.export.BatchSpanProcessor")
+    def test_uses_cli_tuned_defaults(self, mock_processor: Mock) -> None:
+        """Test that Chiron's batch settings apply without env overrides."""
+        exporter = Mock()
+
+        with patch.dict(os.environ, {}, clear=True):
+            _batch_span_processor(exporter)
+
+        mock_processor.assert_called_once_with(
+            exporter,
+            max_queue_size=4096,
+            schedule_delay_millis=1000,
+            max_export_batch_size=128,
+            export_timeout_millis=10000,
+        )
+
+    @patch("opentelemetry.sdk.trace.export.BatchSpanProcessor")
+    def test_env_overrides_and_clamping(self, mock_processor: Mock) -> None:
+        """Test OTEL_BSP_* overrides, invalid values and batch clamping."""
+        env = {
+            "OTEL_BSP_MAX_QUEUE_SIZE": "64",
+            "OTEL_BSP_SCHEDULE_DELAY": "bogus",
+            "OTEL_BSP_EXPORT_TIMEOUT": "2500",
+        }
+
+        with patch.dict(os.environ, env, clear=True):
+            _batch_span_processor(Mock())
+
+        assert mock_processor.call_args.kwargs == {
+            "max_queue_size": 64,
+            "schedule_delay_millis": 1000,
+            "max_export_batch_size": 64,
+            "export_timeout_millis": 2500,
+        }
+
+
 class TestConfigureTracing:
     """Tests for configure_tracing."""
 
@@ -100,6 +160,28 @@ class TestConfigureTracing:
         # Verify console span processor was added
         assert len(provider._active_span_processor._span_processors) >= 1
 
+    @patch("chiron.observability.tracing._TRACING_CONFIGURED", False)
+    @patch("chiron.observability.tracing._load_otlp_exporter")
+    @patch("chiron.observability.tracing.trace.set_tracer_provider")
+    def test_configure_tracing_console_processor_kind(
+        self, mock_set_provider: Mock, mock_load_exporter: Mock
+    ) -> None:
+        """Test that console spans are batched unless sync export is requested."""
+        mock_load_exporter.return_value = None
+
+        with patch.dict(os.environ, {"CHIRON_TRACE_CONSOLE_SYNC": "0"}):
+            batched = configure_tracing("test-service", console_exporter=True)
+        tracing._TRACING_CONFIGURED = False
+        with patch.dict(os.environ, {"CHIRON_TRACE_CONSOLE_SYNC": "1"}):
+            synchronous = configure_tracing("test-service", console_exporter=True)
+
+        (batched_processor,) = batched._active_span_processor._span_processors
+        (sync_processor,) = synchronous._active_span_processor._span_processors
+        assert isinstance(batched_processor, BatchSpanProcessor)
+        assert isinstance(sync_processor, SimpleSpanProcessor)
+        batched.shutdown()
+        synchronous.shutdown()
+
     @patch("chiron.observability.tracing._TRACING_CONFIGURED", False)
     @patch("chiron.observability.tracing._load_otlp_exporter")
     @patch("chiron.observability.tracing.trace.set_tracer_provider")
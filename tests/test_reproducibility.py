@@ -1,10 +1,12 @@
 """Tests for reproducibility checking module."""
 
+import hashlib
 import zipfile
 from pathlib import Path
 
 import pytest
 
+from chiron import reproducibility
 from chiron.reproducibility import (
     ReproducibilityChecker,
     ReproducibilityReport,
@@ -221,6 +223,41 @@ class TestReproducibilityChecker:
         assert len(wheel_info.file_list) > 0
         assert "test_package/__init__.py" in wheel_info.file_list
 
+    def test_analyze_wheel_digest_matches_file_bytes(self, tmp_wheel: Path):
+        """Test that the streamed digest matches hashing the whole file."""
+        checker = ReproducibilityChecker()
+        wheel_info = checker.analyze_wheel(tmp_wheel)
+
+        assert wheel_info.sha256 == hashlib.sha256(tmp_wheel.read_bytes()).hexdigest()
+
+    def test_analyze_wheel_reuses_analysis_until_file_changes(
+        self, tmp_wheel: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that unchanged wheels are hashed once and results stay isolated."""
+        calls: list[Path] = []
+        original_digest = hashlib.file_digest
+
+        def counting_digest(fileobj, digest):
+            calls.append(Path(fileobj.name))
+            return original_digest(fileobj, digest)
+
+        monkeypatch.setattr(reproducibility.hashlib, "file_digest", counting_digest)
+        checker = ReproducibilityChecker()
+
+        first = checker.analyze_wheel(tmp_wheel)
+        first.file_list.clear()
+        second = checker.analyze_wheel(tmp_wheel)
+
+        assert calls == [tmp_wheel]
+        assert second.file_list
+
+        with zipfile.ZipFile(tmp_wheel, "a") as zf:
+            zf.writestr("test_package/extra.py", "# extra\n")
+        third = checker.analyze_wheel(tmp_wheel)
+
+        assert len(calls) == 2
+        assert "test_package/extra.py" in third.file_list
+
     def test_analyze_wheel_metadata(self, tmp_wheel: Path):
         """Test wheel metadata extraction."""
         checker = ReproducibilityChecker()
@@ -271,6 +308,49 @@ class TestReproducibilityChecker:
         assert result["different_files"] > 0
         assert "differences" in result
 
+    def test_compare_wheel_contents_streams_large_members(self, tmp_path: Path):
+        """Test that late differences in multi-chunk members are reported."""
+        payload1 = b"a" * 200_000
+        payload2 = payload1[:-1] + b"b"
+        wheels = []
+        for index, payload in enumerate((payload1, payload1, payload2)):
+            wheel_path = tmp_path / f"large-{index}.whl"
+            with zipfile.ZipFile(wheel_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("pkg/data.bin", payload)
+            wheels.append(wheel_path)
+
+        checker = ReproducibilityChecker()
+        same = checker.compare_wheel_contents(wheels[0], wheels[1])
+        changed = checker.compare_wheel_contents(wheels[0], wheels[2])
+
+        assert same["identical_files"] == 1
+        assert changed["different_files"] == 1
+        assert changed["differences"] == [
+            {
+                "file": "pkg/data.bin",
+                "size1": len(payload1),
+                "size2": len(payload2),
+                "hash1": hashlib.sha256(payload1).hexdigest()[:16],
+                "hash2": hashlib.sha256(payload2).hexdigest()[:16],
+            }
+        ]
+
+    def test_compare_wheel_contents_parallel_matches_serial(
+        self,
+        tmp_wheel: Path,
+        tmp_wheel_different: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that the threaded comparison reports the same outcome."""
+        checker = ReproducibilityChecker()
+        serial = checker.compare_wheel_contents(tmp_wheel, tmp_wheel_different)
+
+        monkeypatch.setattr(reproducibility, "_PARALLEL_MIN_MEMBERS", 1)
+        monkeypatch.setattr(reproducibility.os, "cpu_count", lambda: 2)
+        parallel = checker.compare_wheel_contents(tmp_wheel, tmp_wheel_different)
+
+        assert parallel == serial
+
     def test_parse_metadata(self):
         """Test metadata parsing."""
         checker = ReproducibilityChecker()